@@ -0,0 +1,283 @@
+"""
+Scrape pipeline benchmarks
+Times verification against the local mock job board plus filtering, saving, sequence allocation and viewing over synthetic histories, and compares against a stored baseline
+"""
+
+import argparse
+import gc
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from job_records import as_record
+from mock_job_board import MockJobBoard
+from real_job_scraper import RealJobScraper
+
+COMPANIES = ['Razorpay', 'PhonePe', 'CRED', 'Zerodha', 'Groww', 'Paytm', 'Google', 'Microsoft', 'Amazon', 'Adobe']
+POSITIONS = ['Backend Engineer', 'Full Stack Developer', 'SDE 1', 'Android Developer', 'Software Engineer Intern']
+DESCRIPTIONS = [
+    'Backend systems for payments. Remote work available. PPO up to {ppo} LPA.',
+    'Build trading features with React and Go. Stipend {stipend} per month.',
+    'Mobile app development for UPI wallets. Work from home option.',
+    'Software engineering on lending infrastructure. PPO {ppo} LPA after internship.'
+]
+
+DEFAULT_BASELINE = os.path.join('benchmarks', 'baseline.json')
+
+
+def synthetic_jobs(count, days=30, seed=0):
+    """Job dicts spread over the last `days` days, generated with NumPy so 1M rows stay quick"""
+    rng = np.random.default_rng(seed)
+    now = datetime.now()
+    ages = rng.integers(0, days * 86400, count)
+    companies = rng.integers(0, len(COMPANIES), count)
+    positions = rng.integers(0, len(POSITIONS), count)
+    descriptions = rng.integers(0, len(DESCRIPTIONS), count)
+    ppos = rng.integers(6, 40, count)
+
+    jobs = []
+    for i in range(count):
+        company = COMPANIES[companies[i]]
+        jobs.append({
+            'company_name': company,
+            'offered_position': POSITIONS[positions[i]],
+            'direct_apply_link': f'https://careers.{company.lower()}.com/jobs/{i}',
+            'job_description': DESCRIPTIONS[descriptions[i]].format(ppo=ppos[i], stipend=ppos[i] * 2500),
+            'hr_email': f'careers@{company.lower()}.com',
+            'scraped_at': (now - timedelta(seconds=int(ages[i]))).isoformat()
+        })
+    return jobs
+
+
+@contextmanager
+def working_directory(path):
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def measure(func, memory=True):
+    """Run func once for wall time, then (optionally) again under tracemalloc for peak memory"""
+    gc.collect()
+    started = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - started
+
+    peak_mib = None
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            func()
+            peak_mib = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+        finally:
+            tracemalloc.stop()
+    return result, seconds, peak_mib
+
+
+def new_scraper(**kwargs):
+    """Scraper writing into the current (temporary) directory, quiet on the network side"""
+    options = {
+        'use_live_sources': False,
+        'cache_path': None,
+        'seen_index_path': None,
+        'dedup': False,
+        'parse_workers': 0
+    }
+    options.update(kwargs)
+    return RealJobScraper(**options)
+
+
+class Quiet:
+    """Silence the scraper's per-posting prints while a benchmark runs"""
+
+    def __enter__(self):
+        self._stdout = sys.stdout
+        sys.stdout = open(os.devnull, 'w', encoding='utf-8')
+
+    def __exit__(self, *exc):
+        sys.stdout.close()
+        sys.stdout = self._stdout
+
+
+def bench_verify(urls, board_options, memory, head_first=True):
+    """End-to-end run over mock career pages: verify, dedup, filter and save, with per-stage times"""
+    with MockJobBoard(**board_options) as board:
+        def run():
+            scraper = new_scraper(max_retries=1, host_rate=1000.0, head_first=head_first)
+            jobs = board.career_jobs(urls)
+            scraper.get_seed_job_postings = lambda: jobs
+            with Quiet():
+                scraper.create_real_job_links()
+                with scraper.metrics.stage('save'):
+                    scraper.save_real_jobs()
+            return scraper
+
+        scraper, seconds, peak = measure(run, memory)
+    # Throughput counts URLs actually verified, not ones skipped or cut off by the deadline
+    verified = scraper.verification_stats.get('verified', 0)
+    return {
+        'size': urls,
+        'seconds': round(seconds, 4),
+        'verified': verified,
+        'per_second': round(verified / seconds, 1),
+        'peak_mib': round(peak, 1) if peak is not None else None,
+        'stages_seconds': scraper.metrics.report()['stages_seconds'],
+        'requests': len(board.requests),
+        'tiers': scraper.verification_stats.get('tiers', {})
+    }
+
+
+def bench_history(size, memory):
+    """filter_latest_jobs, save_real_jobs, sequence allocation and the viewer over a synthetic history"""
+    from display_real_jobs import load_page
+
+    results = {}
+    # The pipeline hands filter_latest_jobs compact records, so the benchmark does too
+    jobs = [as_record(job) for job in synthetic_jobs(size)]
+    scraper = new_scraper()
+
+    def record(name, func, count):
+        result, seconds, peak = measure(func, memory)
+        results[name] = {
+            'size': count,
+            'seconds': round(seconds, 4),
+            'per_second': round(count / seconds, 1) if seconds else None,
+            'peak_mib': round(peak, 1) if peak is not None else None
+        }
+        return result
+
+    latest = record('filter_latest_jobs', lambda: scraper.filter_latest_jobs(jobs), size)
+
+    def save():
+        scraper.jobs_data = latest
+        with Quiet():
+            return scraper.save_real_jobs()
+
+    _, saved_path = record('save_real_jobs', save, len(latest))
+    record('get_next_sequence_number', lambda: [scraper.get_next_sequence_number() for _ in range(200)], 200)
+    record('view_first_page', lambda: load_page(saved_path, {}, limit=50), size)
+    record('view_filtered', lambda: load_page(saved_path, {'company': 'razor', 'min_ppo': 20}, limit=50), size)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Benchmarks that got slower than baseline by more than threshold (a fraction)"""
+    regressions = []
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if not previous or not previous.get('seconds'):
+            continue
+        ratio = current['seconds'] / previous['seconds']
+        current['vs_baseline'] = round(ratio, 3)
+        if ratio > 1 + threshold:
+            regressions.append((key, previous['seconds'], current['seconds'], ratio))
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the scrape pipeline')
+    parser.add_argument('--sizes', default='10000', help='Comma-separated synthetic history sizes (e.g. 10000,100000,1000000)')
+    parser.add_argument('--verify-urls', type=int, default=500, help='Career pages to verify end to end (0 skips)')
+    parser.add_argument('--latency', type=float, default=0.01, help='Mock career page latency in seconds')
+    parser.add_argument('--body-size', type=int, default=20 * 1024)
+    parser.add_argument('--closed-ratio', type=float, default=0.2)
+    parser.add_argument('--redirect-ratio', type=float, default=0.1)
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--gone-ratio', type=float, default=0.05)
+    parser.add_argument('--landing-ratio', type=float, default=0.05)
+    parser.add_argument('--get-only', action='store_true', help='Skip the HEAD triage tier when verifying')
+    parser.add_argument('--no-memory', action='store_true', help='Skip the tracemalloc pass (halves run time)')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--save-baseline', action='store_true', help='Store these results as the new baseline')
+    parser.add_argument('--threshold', type=float, default=0.2, help='Allowed slowdown before failing (0.2 = 20%%)')
+    parser.add_argument('--output', help='Also write the results JSON here')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    memory = not args.no_memory
+    results = {}
+    workdir = tempfile.mkdtemp(prefix='scraper_bench_')
+    baseline_path = os.path.abspath(args.baseline)
+    output_path = os.path.abspath(args.output) if args.output else None
+
+    try:
+        with working_directory(workdir):
+            if args.verify_urls:
+                board_options = {
+                    'latency': args.latency,
+                    'body_size': args.body_size,
+                    'closed_ratio': args.closed_ratio,
+                    'redirect_ratio': args.redirect_ratio,
+                    'rate_limit_rate': args.rate_limit_rate,
+                    'error_rate': args.error_rate,
+                    'gone_ratio': args.gone_ratio,
+                    'landing_ratio': args.landing_ratio,
+                    'retry_after': 0
+                }
+                print(f"⏱️ End-to-end verify over {args.verify_urls} mock career pages...")
+                result = bench_verify(args.verify_urls, board_options, memory, head_first=not args.get_only)
+                results[f'end_to_end@{args.verify_urls}'] = result
+
+            for size in [int(value) for value in args.sizes.split(',') if value.strip() and int(value) > 0]:
+                print(f"⏱️ History benchmarks over {size:,} postings...")
+                for name, result in bench_history(size, memory).items():
+                    results[f'{name}@{size}'] = result
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    baseline = {}
+    if os.path.exists(baseline_path):
+        with open(baseline_path, encoding='utf-8') as f:
+            baseline = json.load(f).get('results', {})
+    regressions = compare(results, baseline, args.threshold)
+
+    print(f"\n{'Benchmark':<36} {'Seconds':>10} {'Items/s':>12} {'Peak MiB':>10} {'vs base':>8}")
+    for key, result in results.items():
+        peak = f"{result['peak_mib']:.1f}" if result.get('peak_mib') is not None else '-'
+        ratio = f"{result['vs_baseline']:.2f}x" if 'vs_baseline' in result else '-'
+        print(f"{key:<36} {result['seconds']:>10.4f} {result['per_second'] or 0:>12,.1f} {peak:>10} {ratio:>8}")
+        for stage, seconds in result.get('stages_seconds', {}).items():
+            print(f"  {stage:<34} {seconds:>10.4f}")
+        if result.get('tiers'):
+            print(f"  {result['requests']} requests; verdicts by tier: {result['tiers']}")
+
+    report = {'created_at': datetime.now().isoformat(), 'python': sys.version.split()[0], 'results': results}
+    if output_path:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    if args.save_baseline:
+        directory = os.path.dirname(baseline_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        with open(baseline_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Baseline saved to {baseline_path}")
+
+    if regressions:
+        print(f"\n❌ {len(regressions)} benchmark(s) slower than baseline by more than {args.threshold:.0%}:")
+        for key, before, after, ratio in regressions:
+            print(f"   {key}: {before:.4f}s -> {after:.4f}s ({ratio:.2f}x)")
+        return 1
+    compared = sum('vs_baseline' in result for result in results.values())
+    if compared:
+        print(f"\n✅ No regressions against baseline ({compared} benchmarks compared)")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
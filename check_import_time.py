@@ -0,0 +1,131 @@
+"""
+CLI startup check
+Measures each jobs_cli subcommand's imports with python -X importtime and fails when a heavy module sneaks onto the startup path or a budget is exceeded
+"""
+
+import argparse
+import csv
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+
+from jobs_cli import COMMAND_MODULES
+
+# Modules no subcommand may import before it starts working
+FORBIDDEN = ['pandas', 'numpy', 'pyarrow']
+
+# Milliseconds of imports allowed per subcommand on top of the bare interpreter (requests alone is ~70 ms)
+BUDGETS_MS = {'scrape': 150, 'verify': 150, 'view': 30, 'publish': 20, 'daemon': 175, 'view_small_csv': 40}
+
+DEFAULT_BASELINE = os.path.join('benchmarks', 'import_baseline.json')
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def import_profile(args, cwd=HERE):
+    """Run python -X importtime and return (total import ms, set of imported top-level modules)"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', *args], cwd=cwd,
+                            capture_output=True, text=True, env={**os.environ, 'PYTHONPATH': HERE})
+    if result.returncode != 0:
+        raise RuntimeError(f"{' '.join(args)} failed: {result.stderr.strip().splitlines()[-1:]}")
+
+    total_us = 0
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        total_us += int(self_us)
+        modules.add(name.strip().split('.')[0])
+    return total_us / 1000, modules
+
+
+def interpreter_ms(repeat):
+    """Import time of a bare interpreter (site, encodings, .pth hooks), subtracted from every command"""
+    return min(import_profile(['-c', 'pass'])[0] for _ in range(repeat))
+
+
+def check_command(command, repeat, startup_ms):
+    """Fastest of `repeat` cold imports of one subcommand"""
+    code = f"import jobs_cli; jobs_cli.import_command({command!r})"
+    runs = [import_profile(['-c', code]) for _ in range(repeat)]
+    ms = min(total for total, _ in runs) - startup_ms
+    return {'ms': round(ms, 1), 'forbidden': sorted(set(FORBIDDEN) & runs[0][1])}
+
+
+def check_small_view(startup_ms):
+    """View a tiny CSV snapshot end to end; the light reader must not load pandas"""
+    workdir = tempfile.mkdtemp(prefix='jobs_cli_view_')
+    try:
+        path = os.path.join(workdir, 'jobs.csv')
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['company_name', 'offered_position', 'direct_apply_link', 'job_description', 'hr_email', 'scraped_at'])
+            writer.writerow(['Razorpay', 'Backend Engineer', 'https://razorpay.com/jobs/1', 'Payments. PPO up to 18 LPA.',
+                             'careers@razorpay.com', datetime.now().isoformat()])
+        ms, modules = import_profile([os.path.join(HERE, 'jobs_cli.py'), 'view', '--file', path, '--format', 'json',
+                                      '--company', 'razor', '--min-ppo', '10'], cwd=workdir)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return {'ms': round(ms - startup_ms, 1), 'forbidden': sorted(set(FORBIDDEN) & modules)}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Check jobs_cli startup imports')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per command (the fastest counts)')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--save-baseline', action='store_true', help='Store these timings as the new baseline')
+    parser.add_argument('--threshold', type=float, default=0.3, help='Allowed slowdown against baseline (0.3 = 30%%)')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    repeat = max(args.repeat, 1)
+    startup_ms = interpreter_ms(repeat)
+    results = {command: check_command(command, repeat, startup_ms) for command in COMMAND_MODULES}
+    results['view_small_csv'] = check_small_view(startup_ms)
+
+    baseline = {}
+    baseline_path = os.path.join(HERE, args.baseline)
+    if os.path.exists(baseline_path):
+        with open(baseline_path, encoding='utf-8') as f:
+            baseline = json.load(f).get('results', {})
+
+    failures = []
+    print(f"🐍 Bare interpreter: {startup_ms:.1f} ms of imports (not counted below)")
+    print(f"{'Command':<16} {'Imports ms':>11} {'Budget':>8} {'Baseline':>9}")
+    for name, result in results.items():
+        budget = BUDGETS_MS.get(name)
+        previous = baseline.get(name, {}).get('ms')
+        print(f"{name:<16} {result['ms']:>11.1f} {budget or '-':>8} {previous or '-':>9}")
+        if result['forbidden']:
+            failures.append(f"{name} imports {', '.join(result['forbidden'])} at startup")
+        if budget and result['ms'] > budget:
+            failures.append(f"{name} imports take {result['ms']:.1f} ms (budget {budget} ms)")
+        if previous and result['ms'] > previous * (1 + args.threshold):
+            failures.append(f"{name} imports slowed from {previous:.1f} ms to {result['ms']:.1f} ms")
+
+    if args.save_baseline:
+        directory = os.path.dirname(baseline_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        with open(baseline_path, 'w', encoding='utf-8') as f:
+            json.dump({'created_at': datetime.now().isoformat(), 'python': sys.version.split()[0],
+                       'results': results}, f, indent=2)
+        print(f"\n💾 Baseline saved to {baseline_path}")
+
+    if failures:
+        print(f"\n❌ {len(failures)} startup regression(s):")
+        for failure in failures:
+            print(f"   {failure}")
+        return 1
+    print("\n✅ Startup imports within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,148 @@
+"""
+Duplicate posting detection
+Drops exact and near-duplicate postings across sources within a run using key hashing plus SimHash with LSH banding
+"""
+
+import hashlib
+import re
+import zlib
+
+import numpy as np
+
+from verification_cache import normalize_url
+
+COMPANY_SUFFIXES = re.compile(
+    r'\b(inc|ltd|limited|llc|llp|pvt|private|corp|corporation|co|technologies|technology|labs|india)\b'
+)
+NON_ALNUM = re.compile(r'[^a-z0-9]+')
+TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+SIMHASH_BITS = 64
+LSH_BANDS = 8
+BAND_BITS = SIMHASH_BITS // LSH_BANDS
+_BIT_WEIGHTS = np.left_shift(np.uint64(1), np.arange(SIMHASH_BITS, dtype=np.uint64))
+
+
+def normalize_company(name):
+    """Company key that ignores case, punctuation and legal suffixes"""
+    name = NON_ALNUM.sub(' ', str(name or '').lower())
+    name = COMPANY_SUFFIXES.sub(' ', name)
+    return ' '.join(name.split())
+
+
+SHINGLE_SIZE = 4
+
+
+def _shingle_hashes(shingles):
+    """Stable 64-bit hashes (two CRC32s) so signatures survive across processes and runs"""
+    return np.array(
+        [(zlib.crc32(s.encode('utf-8')) << 32) | zlib.crc32(s.encode('utf-8'), 0x9E3779B9) for s in shingles],
+        dtype=np.uint64
+    )
+
+
+def simhash(title, description):
+    """64-bit SimHash over character shingles of a posting's title and description"""
+    text = ' '.join(TOKEN_RE.findall(f'{title or ""} {description or ""}'.lower()))
+    # Character shingles are far more stable than words for short, lightly edited postings
+    features = list({text[i:i + SHINGLE_SIZE] for i in range(max(1, len(text) - SHINGLE_SIZE + 1))} - {''})
+    if not features:
+        return 0
+
+    hashes = _shingle_hashes(features)
+    bits = (hashes[:, None] & _BIT_WEIGHTS[None, :]) != 0
+    votes = bits.sum(axis=0) * 2 - len(features)
+    return int((_BIT_WEIGHTS[votes > 0]).sum(dtype=np.uint64))
+
+
+def hamming(a, b):
+    return bin(a ^ b).count('1')
+
+
+def title_tokens(title):
+    return set(TOKEN_RE.findall(str(title or '').lower()))
+
+
+def title_similarity(a, b):
+    """Jaccard similarity of two titles' word sets ("Backend Engineer" vs "Backend Engineer II" is 0.67)"""
+    a, b = title_tokens(a), title_tokens(b)
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+class DedupIndex:
+    """Duplicate postings within one run
+
+    A posting is dropped when its company + canonical link or its normalized company/title/description
+    key was already seen, or when its SimHash is within max_distance bits of an earlier posting at the
+    same company and the two titles are at least min_title_similarity alike. Postings without a
+    description (LinkedIn cards) are matched by link only, as company and title alone do not tell
+    two openings apart.
+    """
+
+    def __init__(self, max_distance=3, min_title_similarity=0.9):
+        # Banding is exact for distances below LSH_BANDS: some band must then match exactly
+        self.max_distance = min(max_distance, LSH_BANDS - 1)
+        self.min_title_similarity = min_title_similarity
+        self.entries = {}
+        self.links = {}
+        self.exact = {}
+        self.bands = {}
+        self.stats = {'checked': 0, 'exact_duplicates': 0, 'near_duplicates': 0}
+
+    def check(self, job):
+        """Return the id of the earlier posting this one duplicates, or None (and remember it) if it is new"""
+        self.stats['checked'] += 1
+        company = normalize_company(job.get('company_name'))
+        link = normalize_url(job.get('direct_apply_link') or '')
+        title = job.get('offered_position')
+
+        link_key = f'{company}|{link}'
+        if link and link_key in self.links:
+            self.stats['exact_duplicates'] += 1
+            return self.links[link_key]
+
+        entry_id = hashlib.sha1(link_key.encode('utf-8')).hexdigest()
+        description = ' '.join(TOKEN_RE.findall(str(job.get('job_description') or '').lower()))
+        if not description:
+            if link:
+                self.links[link_key] = entry_id
+            return None
+
+        content_key = hashlib.sha1('|'.join([
+            company,
+            ' '.join(TOKEN_RE.findall(str(title or '').lower())),
+            description
+        ]).encode('utf-8')).hexdigest()
+        if content_key in self.exact:
+            self.stats['exact_duplicates'] += 1
+            return self.exact[content_key]
+
+        signature = simhash(title, job.get('job_description'))
+        match = self._near_duplicate(company, signature, title)
+        if match:
+            self.stats['near_duplicates'] += 1
+            return match
+
+        self.entries[entry_id] = {'company': company, 'title': title or '', 'simhash': signature}
+        if link:
+            self.links[link_key] = entry_id
+        self.exact[content_key] = entry_id
+        for band_key in self._band_keys(company, signature):
+            self.bands.setdefault(band_key, []).append(entry_id)
+        return None
+
+    def _near_duplicate(self, company, signature, title):
+        for band_key in self._band_keys(company, signature):
+            for candidate_id in self.bands.get(band_key, ()):
+                candidate = self.entries[candidate_id]
+                if (hamming(candidate['simhash'], signature) <= self.max_distance
+                        and title_similarity(candidate['title'], title) >= self.min_title_similarity):
+                    return candidate_id
+        return None
+
+    @staticmethod
+    def _band_keys(company, signature):
+        mask = (1 << BAND_BITS) - 1
+        return [(company, band, (signature >> (band * BAND_BITS)) & mask) for band in range(LSH_BANDS)]
@@ -1,77 +1,272 @@
 """
 Display Real Fintech Jobs with direct job posting links
+Paginated, filterable viewer: filters are applied while loading and only the visible page is rendered
 """
 
-import pandas as pd
-from tabulate import tabulate
-import os
+import argparse
+import csv
 import glob
+import json
+import os
+import sys
+from datetime import datetime
+
+from job_records import parse_timestamp
+from job_scoring import PPO_RE
+from run_manifest import RunManifest
+
+DISPLAY_COLUMNS = ['company_name', 'offered_position', 'direct_apply_link', 'hr_email', 'job_description', 'scraped_at']
+
+# CSV snapshots up to this size (or unfiltered ones, which stop after the page) are read without pandas
+LIGHT_READ_BYTES = 8 * 1024 * 1024
 
 def get_latest_real_csv_file():
-    """Get the latest real CSV file from data folder"""
-    latest_file = 'data/latest_real_fintech_jobs.csv'
-    if os.path.exists(latest_file):
+    """Get the latest real jobs file (CSV, Parquet or Feather) from data folder"""
+    latest_file = RunManifest().latest_path()
+    if latest_file:
         return latest_file
-    
-    pattern = os.path.join('data', 'real_fintech_jobs_*.csv')
+
+    # No manifest yet (or its snapshot was removed): the newest snapshot on disk
+    pattern = os.path.join('data', 'real_fintech_jobs_*.*')
     files = glob.glob(pattern)
-    
+
     if not files:
         return None
-    
+
     latest_file = max(files, key=os.path.getmtime)
     return latest_file
 
-def display_real_jobs_table():
-    """Display real jobs with direct posting links"""
-    csv_file = get_latest_real_csv_file()
-    
-    if not csv_file:
-        print("❌ No real job CSV files found. Please run real_job_scraper.py first.")
-        return
-    
-    try:
-        df = pd.read_csv(csv_file)
-        
-        display_df = df[['company_name', 'offered_position', 'direct_apply_link', 'hr_email']]
-        display_df.columns = ['Company', 'Position', 'Job Posting Link', 'HR Email']
-        
-        # Add posting date if available
-        if 'scraped_at' in df.columns:
-            display_df.insert(1, 'Posted', df['scraped_at'].str[:10])  # Show only date part
-        
-        print("\n" + "="*140)
-        print("🚀 LATEST JOB POSTINGS (Last 7 Days)")
-        print(f"📁 Source: {csv_file}")
-        print("🔗 Direct links to actual job postings (like Grok)")
-        print("📅 Showing only newest job postings")
-        print("="*140)
-        
-        table = tabulate(display_df.values, headers=display_df.columns, 
-                        tablefmt='grid', maxcolwidths=[12, 12, 25, 35, 12])
-        
-        print(table)
-        print("="*140)
-        
+def _bound(value):
+    return value if value is None or isinstance(value, datetime) else datetime.fromisoformat(str(value))
+
+def _row_matches(row, company=None, since=None, until=None, keyword=None, min_ppo=None, min_score=None):
+    """Same semantics as job_storage.filter_jobs, for one CSV row"""
+    if company and company.lower() not in (row.get('company_name') or '').lower():
+        return False
+    if since is not None or until is not None:
+        # Rows without a timestamp never match a date filter, as NaT comparisons are false in pandas
+        scraped_at = row['scraped_at']
+        if scraped_at is None or (since is not None and scraped_at < since) or (until is not None and scraped_at > until):
+            return False
+    if keyword:
+        text = f"{row.get('offered_position') or ''} {row.get('job_description') or ''}"
+        if keyword.lower() not in text.lower():
+            return False
+    if min_ppo is not None:
+        ppo = row.get('ppo_lpa')
+        if ppo in (None, ''):
+            # Files written before scoring existed: extract the amount on the fly
+            match = PPO_RE.search(row.get('job_description') or '')
+            ppo = match.group(1) if match else None
+        try:
+            if float(ppo or 0) < min_ppo:
+                return False
+        except ValueError:
+            return False
+    if min_score is not None:
+        try:
+            if float(row.get('relevance_score') or 0) < min_score:
+                return False
+        except ValueError:
+            return False
+    return True
+
+def read_csv_page(path, filters=None, limit=50, offset=0):
+    """One page of matching rows from a CSV snapshot with the csv module, stopping right after the page"""
+    filters = {key: value for key, value in (filters or {}).items() if value not in (None, '')}
+    for key in ('since', 'until'):
+        if key in filters:
+            filters[key] = _bound(filters[key])
+
+    rows = []
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            row['scraped_at'] = parse_timestamp(row.get('scraped_at') or None)
+            if not _row_matches(row, **filters):
+                continue
+            rows.append({col: row.get(col) or ('' if col != 'scraped_at' else None) for col in DISPLAY_COLUMNS})
+            if len(rows) > offset + limit:
+                break
+    return rows[offset:offset + limit], len(rows) > offset + limit
+
+def use_light_reader(source, filters=None, history=False):
+    """Whether a view can skip pandas: a CSV snapshot that is small or scanned only up to the page"""
+    if history or not source.lower().endswith('.csv'):
+        return False
+    filtered = any(value not in (None, '') for value in (filters or {}).values())
+    return not filtered or os.path.getsize(source) <= LIGHT_READ_BYTES
+
+def _frame_rows(df):
+    """DataFrame rows as plain dicts with datetime (or None) scraped_at"""
+    import pandas as pd
+
+    rows = []
+    for row in df.to_dict('records'):
+        for col, value in row.items():
+            if pd.isna(value):
+                row[col] = None if col == 'scraped_at' else ''
+        if row.get('scraped_at') is not None:
+            row['scraped_at'] = row['scraped_at'].to_pydatetime()
+        rows.append(row)
+    return rows
+
+def load_page(source, filters=None, limit=50, offset=0, history=False):
+    """Load one page of matching jobs (as row dicts) and whether more matches follow it
+
+    A snapshot is read in file order and scanning stops right after the page; the history is shown
+    newest first, as an indexed range query when dates are given and file by file otherwise.
+    Small CSV views never import pandas.
+    """
+    if use_light_reader(source, filters, history):
+        return read_csv_page(source, filters, limit, offset)
+
+    import pandas as pd
+    from job_storage import scan_jobs
+
+    wanted = offset + limit + 1
+    if not history:
+        df = scan_jobs(source, DISPLAY_COLUMNS, filters, max_rows=wanted)
+    elif filters and (filters.get('since') or filters.get('until')):
+        from history_store import JobHistoryStore
+        from job_storage import filter_jobs
+
+        # A date range is a searchsorted slice of the history's scraped_at index, already newest first
+        window = JobHistoryStore(source).query(since=filters.get('since') or None, until=filters.get('until') or None)
+        rest = {key: value for key, value in filters.items() if key not in ('since', 'until')}
+        df = filter_jobs(window, **{key: value for key, value in rest.items() if value not in (None, '')})
+        df = df[DISPLAY_COLUMNS]
+    else:
+        from history_store import JobHistoryStore
+
+        # Newest file first; older files are only read while the page is still short
+        frames = []
+        found = 0
+        for path in reversed(JobHistoryStore(source).files()):
+            frame = scan_jobs(path, DISPLAY_COLUMNS, filters)
+            if len(frame):
+                frames.append(frame)
+                found += len(frame)
+                if found >= wanted:
+                    break
+        if not frames:
+            return [], False
+        df = pd.concat(frames, ignore_index=True).sort_values('scraped_at', ascending=False, kind='stable')
+
+    return _frame_rows(df.iloc[offset:offset + limit]), len(df) > offset + limit
+
+def _posted(row):
+    return row['scraped_at'].strftime('%Y-%m-%d') if row.get('scraped_at') else 'Recent'
+
+def render_table(page, source, offset, has_more, details=True):
+    """Print the visible page as a grid plus per-job details"""
+    from tabulate import tabulate
+
+    headers = ['Company', 'Posted', 'Position', 'Job Posting Link', 'HR Email']
+    # Show only date part
+    values = [[row['company_name'], _posted(row), row['offered_position'], row['direct_apply_link'], row['hr_email']]
+              for row in page]
+
+    print("\n" + "="*140)
+    print("🚀 LATEST JOB POSTINGS")
+    print(f"📁 Source: {source}")
+    print("🔗 Direct links to actual job postings (like Grok)")
+    print("="*140)
+
+    table = tabulate(values, headers=headers,
+                    tablefmt='grid', maxcolwidths=[12, 12, 25, 35, 12])
+
+    print(table)
+    print("="*140)
+
+    if details:
         print("\n📋 JOB DETAILS:")
         print("="*140)
-        
-        for index, row in df.iterrows():
-            posted_date = row['scraped_at'][:10] if 'scraped_at' in row else 'Recent'
+
+        for row in page:
             print(f"\n🏢 {row['company_name']} - {row['offered_position']}")
-            print(f"📅 Posted: {posted_date}")
+            print(f"📅 Posted: {_posted(row)}")
             print("-" * 100)
             print(f"🔗 Job Posting: {row['direct_apply_link']}")
             print(f"📧 HR Email: {row['hr_email']}")
             print(f"📄 Description: {row['job_description']}")
             print()
-        
+
         print("="*140)
-        print(f"📊 Total Jobs: {len(df)}")
-        print("🎉 Click the Job Posting links to view full job details and apply directly!")
-        
+
+    if len(page):
+        more = f" (more available, next page: --offset {offset + len(page)})" if has_more else ""
+        print(f"📊 Showing jobs {offset + 1}-{offset + len(page)}{more}")
+    else:
+        print("📊 No jobs match the given filters")
+    print("🎉 Click the Job Posting links to view full job details and apply directly!")
+
+def render_json(page):
+    """Write the visible page as a JSON array of job records"""
+    json.dump(page, sys.stdout, indent=2, ensure_ascii=False, default=lambda value: value.isoformat())
+    sys.stdout.write('\n')
+
+def render_csv(page):
+    """Write the visible page as CSV"""
+    writer = csv.DictWriter(sys.stdout, fieldnames=DISPLAY_COLUMNS, extrasaction='ignore', lineterminator='\n')
+    writer.writeheader()
+    writer.writerows(page)
+
+def display_real_jobs_table(source=None, filters=None, limit=50, offset=0, output_format='table',
+                            history=False, details=True):
+    """Display real jobs with direct posting links"""
+    if history:
+        source = source or 'data/history'
+    else:
+        source = source or get_latest_real_csv_file()
+
+    if not source:
+        print("❌ No real job CSV files found. Please run real_job_scraper.py first.")
+        return
+
+    try:
+        page, has_more = load_page(source, filters, limit, offset, history)
     except Exception as e:
-        print(f"❌ Error: {e}")
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return
+
+    if output_format == 'json':
+        render_json(page)
+    elif output_format == 'csv':
+        render_csv(page)
+    else:
+        render_table(page, source, offset, has_more, details)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='View scraped fintech job postings')
+    parser.add_argument('--file', help='Job file to read (defaults to the latest run)')
+    parser.add_argument('--history', action='store_true', help='Search the whole job history instead of one run')
+    parser.add_argument('--company', help='Company name contains this text')
+    parser.add_argument('--since', help='Scraped on or after this date (YYYY-MM-DD)')
+    parser.add_argument('--until', help='Scraped on or before this date (YYYY-MM-DD)')
+    parser.add_argument('--keyword', help='Title or description contains this text')
+    parser.add_argument('--min-ppo', type=float, help='Minimum PPO in LPA')
+    parser.add_argument('--min-score', type=float, help='Minimum relevance score')
+    parser.add_argument('--limit', type=int, default=50, help='Jobs per page')
+    parser.add_argument('--offset', type=int, default=0, help='Jobs to skip')
+    parser.add_argument('--format', choices=['table', 'json', 'csv'], default='table', dest='output_format')
+    parser.add_argument('--no-details', action='store_true', help='Only print the summary table')
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    until = args.until
+    if until and len(until) == 10:
+        until = f'{until} 23:59:59.999999'  # Whole day inclusive
+    filters = {
+        'company': args.company,
+        'since': args.since,
+        'until': until,
+        'keyword': args.keyword,
+        'min_ppo': args.min_ppo,
+        'min_score': args.min_score
+    }
+    display_real_jobs_table(args.file, filters, max(args.limit, 0), max(args.offset, 0),
+                            args.output_format, args.history, not args.no_details)
 
 if __name__ == "__main__":
-    display_real_jobs_table()
+    main()
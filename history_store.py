@@ -0,0 +1,145 @@
+"""
+Job history store
+Append-only store that merges every run's snapshot into one dataset indexed by scraped_at for fast time-window queries
+"""
+
+import glob
+import os
+import re
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from job_storage import FORMATS, write_jobs, read_jobs, apply_types, resolve_format
+
+
+def _bound(value, tz):
+    """Timestamp comparable with an index in timezone tz (naive bounds are local time)"""
+    bound = pd.Timestamp(value)
+    if tz is not None and bound.tz is None:
+        bound = pd.Timestamp(bound.to_pydatetime().astimezone()).tz_convert(tz)
+    elif tz is None and bound.tz is not None:
+        bound = bound.tz_convert(None)
+    return bound
+
+
+def time_window(frame, since=None, until=None):
+    """Rows of a frame indexed by sorted scraped_at with since <= scraped_at <= until, newest first"""
+    index = frame.index
+    start = index.searchsorted(_bound(since, index.tz), side='left') if since is not None else 0
+    stop = index.searchsorted(_bound(until, index.tz), side='right') if until is not None else len(index)
+    return frame.iloc[start:stop].iloc[::-1]
+
+
+class JobHistoryStore:
+    def __init__(self, root='data/history', fmt='csv', compact_after=20):
+        self.root = root
+        self.fmt = resolve_format(fmt)
+        self.compact_after = compact_after
+        self._frame = None
+        self._loaded_state = None
+
+    @property
+    def compacted_path(self):
+        return os.path.join(self.root, 'history' + FORMATS[self.fmt][0])
+
+    def compacted_files(self):
+        """Compacted history files present, whatever format the store was compacted in"""
+        paths = [os.path.join(self.root, 'history' + ext) for ext, _ in FORMATS.values()]
+        return [path for path in paths if os.path.exists(path)]
+
+    def part_files(self):
+        """Run snapshots appended since the last compaction, oldest first"""
+        return sorted(glob.glob(os.path.join(self.root, 'part_*.*')))
+
+    def files(self):
+        """Every file holding history rows, oldest rows first: the compacted file (if any) then the parts"""
+        return self.compacted_files() + self.part_files()
+
+    def append(self, df, run_id):
+        """Append one run's snapshot as a new part file"""
+        # Created by the first write, so readers never leave an empty store behind
+        if not os.path.exists(self.root):
+            os.makedirs(self.root)
+        path = write_jobs(df, os.path.join(self.root, f'part_{run_id}'), self.fmt)
+        self._record_run(run_id)
+        if len(self.part_files()) >= self.compact_after:
+            self.compact()
+        return path
+
+    def import_snapshots(self, pattern=os.path.join('data', 'real_fintech_jobs_*.*')):
+        """Import per-run snapshot files saved before the store existed, keyed by their run sequence"""
+        known = self._recorded_runs() | {os.path.splitext(os.path.basename(p))[0][len('part_'):]
+                                         for p in self.part_files()}
+        imported = 0
+        for snapshot in sorted(glob.glob(pattern)):
+            match = re.match(r'real_fintech_jobs_(\d+)_', os.path.basename(snapshot))
+            if not match:
+                continue
+            run_id = f'{int(match.group(1)):06d}'
+            if run_id in known:
+                continue
+            self.append(read_jobs(snapshot), run_id)
+            known.add(run_id)
+            imported += 1
+        # Imported runs are older than anything appended later, so fold them into the compacted file
+        if imported:
+            self.compact()
+        return imported
+
+    def compact(self):
+        """Merge all parts (and a compacted file in another format) into the single sorted history file"""
+        parts = self.part_files()
+        stale = [path for path in self.compacted_files() if path != self.compacted_path]
+        if not parts and not stale:
+            return
+        frame = self._read_all()
+        write_jobs(frame.reset_index(drop=True), os.path.splitext(self.compacted_path)[0], self.fmt)
+        for path in parts + stale:
+            os.remove(path)
+        self._frame = None
+
+    def load(self, columns=None):
+        """Load the full history indexed and sorted by scraped_at"""
+        state = self._state()
+        if self._frame is None or self._loaded_state != state:
+            frame = self._read_all()
+            self._frame = frame.set_index('scraped_at', drop=False)
+            self._loaded_state = state
+        return self._frame[columns] if columns else self._frame
+
+    def query(self, days_old=7, now=None, columns=None, since=None, until=None):
+        """Jobs scraped within the last days_old days (or between since and until), newest first"""
+        if since is None and until is None:
+            now = now or datetime.now()
+            since, until = now - timedelta(days=days_old), now
+        window = time_window(self.load(), since, until)
+        return window[columns] if columns else window
+
+    def _read_all(self):
+        """Read the compacted file and all parts into one frame sorted by scraped_at"""
+        frames = [read_jobs(path) for path in self.files()]
+        if not frames:
+            return apply_types(pd.DataFrame(columns=['company_name', 'offered_position', 'direct_apply_link',
+                                                     'job_description', 'hr_email', 'scraped_at']))
+
+        frame = pd.concat([apply_types(f) for f in frames], ignore_index=True)
+        frame = apply_types(frame.drop_duplicates())
+        frame = frame.dropna(subset=['scraped_at'])
+        return frame.sort_values('scraped_at', kind='stable').reset_index(drop=True)
+
+    def _state(self):
+        """File sizes and mtimes used to detect changes since the last load"""
+        files = self.files()
+        return tuple((f, os.path.getmtime(f), os.path.getsize(f)) for f in files)
+
+    def _record_run(self, run_id):
+        with open(os.path.join(self.root, 'runs.txt'), 'a', encoding='utf-8') as f:
+            f.write(f'{run_id}\n')
+
+    def _recorded_runs(self):
+        try:
+            with open(os.path.join(self.root, 'runs.txt'), encoding='utf-8') as f:
+                return set(line.strip() for line in f)
+        except OSError:
+            return set()
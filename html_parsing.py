@@ -0,0 +1,169 @@
+"""
+Listing page parsing
+Extracts compact job dicts from search result HTML, optionally in worker processes so CPU-bound parsing overlaps network I/O
+"""
+
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from urllib.parse import urljoin
+
+
+def _has_module(name):
+    try:
+        __import__(name)
+        return True
+    except ImportError:
+        return False
+
+
+class SoupBackend:
+    """BeautifulSoup with the lxml tree builder (html.parser when lxml is missing)"""
+
+    name = 'bs4'
+
+    def __init__(self):
+        self.features = 'lxml' if _has_module('lxml') else 'html.parser'
+
+    def parse(self, html):
+        from bs4 import BeautifulSoup
+        return BeautifulSoup(html, self.features)
+
+    def select(self, node, selector):
+        return node.select(selector)
+
+    def select_one(self, node, selector):
+        return node.select_one(selector)
+
+    def text(self, node):
+        return node.get_text(' ', strip=True) if node is not None else ''
+
+    def attr(self, node, name):
+        return (node.get(name) or '') if node is not None else ''
+
+
+class SelectolaxBackend:
+    """selectolax (Lexbor) fast path, several times quicker than building a soup"""
+
+    name = 'selectolax'
+
+    def parse(self, html):
+        from selectolax.lexbor import LexborHTMLParser
+        return LexborHTMLParser(html)
+
+    def select(self, node, selector):
+        return node.css(selector)
+
+    def select_one(self, node, selector):
+        return node.css_first(selector)
+
+    def text(self, node):
+        return ' '.join(node.text(separator=' ').split()) if node is not None else ''
+
+    def attr(self, node, name):
+        return (node.attributes.get(name) or '') if node is not None else ''
+
+
+BACKENDS = {'bs4': SoupBackend, 'selectolax': SelectolaxBackend}
+
+
+def default_backend():
+    """Fastest installed backend name"""
+    return 'selectolax' if _has_module('selectolax') else 'bs4'
+
+
+def parse_linkedin(backend, html, base_url):
+    """LinkedIn guest API job cards"""
+    root = backend.parse(html)
+    jobs = []
+    for card in backend.select(root, 'div.base-card, div.base-search-card'):
+        link = backend.select_one(card, 'a.base-card__full-link') or backend.select_one(card, 'a[href]')
+        posted = backend.select_one(card, 'time')
+        location = backend.text(backend.select_one(card, '.job-search-card__location'))
+        jobs.append({
+            'title': backend.text(backend.select_one(card, '.base-search-card__title')),
+            'company': backend.text(backend.select_one(card, '.base-search-card__subtitle')),
+            'link': backend.attr(link, 'href').split('?')[0],
+            'location': location,
+            'posted': backend.attr(posted, 'datetime') or backend.text(posted),
+            # Cards carry no description; the location would otherwise feed scoring and dedup
+            'description': ''
+        })
+    return jobs
+
+
+def parse_indeed(backend, html, base_url):
+    """Indeed search result cards"""
+    root = backend.parse(html)
+    jobs = []
+    for card in backend.select(root, 'div.job_seen_beacon, div.result'):
+        title = backend.select_one(card, 'a.jcs-JobTitle') or backend.select_one(card, 'h2.jobTitle a')
+        company = (backend.select_one(card, '[data-testid="company-name"]')
+                   or backend.select_one(card, 'span.companyName'))
+        location = (backend.select_one(card, '[data-testid="text-location"]')
+                    or backend.select_one(card, 'div.companyLocation'))
+        href = backend.attr(title, 'href')
+        jobs.append({
+            'title': backend.text(title),
+            'company': backend.text(company),
+            'link': urljoin(base_url, href) if href else '',
+            'location': backend.text(location),
+            'posted': backend.text(backend.select_one(card, 'span.date')),
+            'description': backend.text(backend.select_one(card, 'div.job-snippet'))
+        })
+    return jobs
+
+
+PARSERS = {'linkedin': parse_linkedin, 'indeed': parse_indeed}
+
+
+def parse_html(parser, html, base_url='', backend=None):
+    """Parse one listing page into plain dicts (safe to send back from a worker process)"""
+    return PARSERS[parser](BACKENDS[backend or default_backend()](), html, base_url)
+
+
+def completed_future(func, *args):
+    """Run func now and wrap the outcome in a finished Future"""
+    future = Future()
+    try:
+        future.set_result(func(*args))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+class ParsePool:
+    """Process pool for listing-page parsing; max_workers=0 parses inline"""
+
+    def __init__(self, max_workers=2, backend=None):
+        self.max_workers = max_workers
+        self.backend = backend or default_backend()
+        self.pages = 0
+        self._executor = None
+
+    def submit(self, parser, html, base_url=''):
+        """Queue a page for parsing and return a Future of its job dicts"""
+        self.pages += 1
+        if not self.max_workers:
+            return completed_future(parse_html, parser, html, base_url, self.backend)
+        if self._executor is None:
+            # spawn: forking would copy the verifier's threads and locks into the workers
+            self._executor = ProcessPoolExecutor(self.max_workers, mp_context=multiprocessing.get_context('spawn'))
+        try:
+            return self._executor.submit(parse_html, parser, html, base_url, self.backend)
+        except BrokenProcessPool:
+            print("⚠️ Parse workers died, parsing inline from now on")
+            self.max_workers = 0
+            self.close()
+            return completed_future(parse_html, parser, html, base_url, self.backend)
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
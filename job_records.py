@@ -0,0 +1,156 @@
+"""
+Compact job records
+Slotted job record with interned company/host strings and a parsed scraped_at, plus a columnar batch builder that feeds pandas or Arrow directly
+"""
+
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from urllib.parse import urlsplit
+
+FIELDS = ['company_name', 'offered_position', 'direct_apply_link', 'job_description', 'hr_email', 'scraped_at',
+          'source', 'host', 'location', 'posted_date', 'days_old', 'verified_by']
+
+# Low-cardinality columns: one shared string object per distinct value
+INTERNED = ('company_name', 'source', 'host', 'verified_by')
+
+
+def parse_timestamp(value):
+    """Naive local datetime from an ISO string or datetime (None if missing or unparseable)"""
+    # value != value catches NaN/NaT without importing pandas
+    if value is None or value != value:
+        return None
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        try:
+            parsed = datetime.fromisoformat(str(value).strip())
+        except ValueError:
+            return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
+
+
+def _interned(value):
+    return sys.intern(str(value or ''))
+
+
+def _host_of(url):
+    try:
+        return (urlsplit(url).hostname or '').lower()
+    except ValueError:
+        return ''
+
+
+@dataclass(slots=True)
+class JobRecord:
+    company_name: str
+    offered_position: str
+    direct_apply_link: str
+    job_description: str = ''
+    hr_email: str = ''
+    scraped_at: datetime = None
+    source: str = 'Curated'
+    host: str = ''
+    location: str = ''
+    posted_date: str = ''
+    days_old: int = None
+    verified_by: str = ''
+
+    @classmethod
+    def from_dict(cls, job):
+        """Build a record from a scraper job dict"""
+        link = job.get('direct_apply_link') or ''
+        return cls(
+            company_name=_interned(job.get('company_name')),
+            offered_position=job.get('offered_position') or '',
+            direct_apply_link=link,
+            job_description=job.get('job_description') or '',
+            hr_email=job.get('hr_email') or '',
+            scraped_at=parse_timestamp(job.get('scraped_at')),
+            source=_interned(job.get('source') or 'Curated'),
+            host=_interned(_host_of(link)),
+            location=job.get('location') or '',
+            posted_date=job.get('posted_date') or '',
+            days_old=job.get('days_old'),
+            verified_by=_interned(job.get('verified_by'))
+        )
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in FIELDS}
+
+    # Mapping-style access so code written against job dicts keeps working
+    def __getitem__(self, key):
+        if key not in FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        if key not in FIELDS:
+            return default
+        value = getattr(self, key)
+        return default if value is None else value
+
+
+def as_record(job):
+    """Pass records through, convert job dicts"""
+    return job if isinstance(job, JobRecord) else JobRecord.from_dict(job)
+
+
+class JobBatchBuilder:
+    """Accumulates jobs column by column and hands them to pandas/Arrow without a dict per row"""
+
+    def __init__(self):
+        self.columns = {name: [] for name in FIELDS}
+
+    def __len__(self):
+        return len(self.columns['company_name'])
+
+    def append(self, job):
+        record = as_record(job)
+        for name, column in self.columns.items():
+            column.append(getattr(record, name))
+
+    def extend(self, jobs):
+        for job in jobs:
+            self.append(job)
+        return self
+
+    @classmethod
+    def from_records(cls, jobs):
+        return cls().extend(jobs)
+
+    def to_frame(self, columns=None):
+        """DataFrame with datetime scraped_at and categorical company/source/host/tier"""
+        import pandas as pd
+
+        data = {}
+        for name in columns or FIELDS:
+            values = self.columns[name]
+            if name == 'scraped_at':
+                data[name] = pd.to_datetime(pd.Series(values, dtype='object'), errors='coerce')
+            elif name in INTERNED:
+                data[name] = pd.Categorical(values)
+            elif name == 'days_old':
+                data[name] = pd.array(values, dtype='Int64')
+            else:
+                data[name] = values
+        return pd.DataFrame(data)
+
+    def to_arrow(self, columns=None):
+        """pyarrow Table with dictionary-encoded company/source/host/tier (requires pyarrow)"""
+        import pyarrow as pa
+
+        arrays = {}
+        for name in columns or FIELDS:
+            values = self.columns[name]
+            if name == 'scraped_at':
+                arrays[name] = pa.array(values, type=pa.timestamp('us'))
+            elif name in INTERNED:
+                arrays[name] = pa.array(values, type=pa.string()).dictionary_encode()
+            elif name == 'days_old':
+                arrays[name] = pa.array(values, type=pa.int32())
+            else:
+                arrays[name] = pa.array(values, type=pa.string())
+        return pa.table(arrays)
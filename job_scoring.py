@@ -0,0 +1,97 @@
+"""
+Job relevance scoring and field extraction
+Vectorized pandas/NumPy pass that extracts PPO/stipend amounts, remote and fintech flags and role category, then scores every posting
+"""
+
+import re
+
+PPO_RE = re.compile(r'ppo[^\d.]{0,25}?(\d+(?:\.\d+)?)\s*(?:-|to)?\s*(?:\d+(?:\.\d+)?)?\s*lpa', re.IGNORECASE)
+STIPEND_RE = re.compile(r'stipend[^\d]{0,25}?(\d[\d,]*(?:\.\d+)?)\s*(k\b)?', re.IGNORECASE)
+REMOTE_RE = re.compile(r'\b(?:remote|work[\s-]from[\s-]home|wfh)\b', re.IGNORECASE)
+FINTECH_RE = re.compile(
+    r'\b(?:fintech|payments?|upi|banking|lending|trading|invest(?:ment|ing)?|credit|wallet|insurtech|neobank)\b',
+    re.IGNORECASE
+)
+
+# Checked in order; the first matching pattern decides the category
+ROLE_PATTERNS = [
+    ('full_stack', re.compile(r'\bfull[\s-]?stack\b', re.IGNORECASE)),
+    ('backend', re.compile(r'\bback[\s-]?end\b', re.IGNORECASE)),
+    ('app_development', re.compile(r'\b(?:android|ios|mobile|flutter|react native|app develop\w*)\b', re.IGNORECASE)),
+    ('sde', re.compile(r'\b(?:sde|swe|software (?:development )?engineer|software developer)\b', re.IGNORECASE)),
+]
+
+DEFAULT_WEIGHTS = {
+    'remote': 2.0,
+    'fintech': 3.0,
+    'ppo': 1.0,
+    'ppo_per_10_lpa': 0.5,
+    'stipend': 0.5,
+    'roles': {'backend': 2.0, 'full_stack': 2.0, 'app_development': 1.5, 'sde': 1.5, 'other': 0.0}
+}
+
+SCORE_COLUMNS = ['ppo_lpa', 'stipend_inr', 'is_remote', 'is_fintech', 'role_category', 'relevance_score']
+
+
+def merge_weights(defaults, overrides):
+    """Overrides applied key by key, so {'roles': {'sde': 3}} keeps the other role weights"""
+    merged = dict(defaults)
+    for key, value in (overrides or {}).items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            value = merge_weights(merged[key], value)
+        merged[key] = value
+    return merged
+
+
+def enrich_jobs(df, weights=None):
+    """Add extracted fields and a relevance score to a job DataFrame without per-row Python"""
+    import numpy as np
+    import pandas as pd
+
+    weights = merge_weights(DEFAULT_WEIGHTS, weights)
+    df = df.copy()
+
+    title = df['offered_position'].fillna('').astype(str)
+    text = title + ' ' + df['job_description'].fillna('').astype(str)
+
+    df['ppo_lpa'] = pd.to_numeric(text.str.extract(PPO_RE, expand=False), errors='coerce').astype('float64')
+
+    stipend = text.str.extract(STIPEND_RE)
+    amount = pd.to_numeric(stipend[0].str.replace(',', '', regex=False), errors='coerce')
+    df['stipend_inr'] = (amount * np.where(stipend[1].notna(), 1000, 1)).astype('float64')
+
+    df['is_remote'] = text.str.contains(REMOTE_RE, na=False)
+    df['is_fintech'] = (text + ' ' + df['company_name'].fillna('').astype(str)).str.contains(FINTECH_RE, na=False)
+
+    conditions = [text.str.contains(pattern, na=False).to_numpy() for _, pattern in ROLE_PATTERNS]
+    names = [name for name, _ in ROLE_PATTERNS]
+    df['role_category'] = pd.Categorical(np.select(conditions, names, default='other'),
+                                         categories=names + ['other'])
+
+    role_weights = weights['roles']
+    score = (
+        df['is_remote'].to_numpy() * weights['remote']
+        + df['is_fintech'].to_numpy() * weights['fintech']
+        + df['ppo_lpa'].notna().to_numpy() * weights['ppo']
+        + df['ppo_lpa'].fillna(0).to_numpy() / 10 * weights['ppo_per_10_lpa']
+        + df['stipend_inr'].notna().to_numpy() * weights['stipend']
+        + np.select(conditions, [role_weights.get(name, 0.0) for name in names], default=role_weights.get('other', 0.0))
+    )
+    df['relevance_score'] = np.round(score, 3)
+    return df
+
+
+def rank_jobs(df, min_score=None, min_ppo=None, remote_only=False, roles=None):
+    """Filter enriched jobs in bulk and order them by relevance"""
+    import numpy as np
+
+    mask = np.ones(len(df), dtype=bool)
+    if min_score is not None:
+        mask &= (df['relevance_score'] >= min_score).to_numpy()
+    if min_ppo is not None:
+        mask &= (df['ppo_lpa'].fillna(0) >= min_ppo).to_numpy()
+    if remote_only:
+        mask &= df['is_remote'].to_numpy()
+    if roles:
+        mask &= df['role_category'].isin(roles).to_numpy()
+    return df[mask].sort_values('relevance_score', ascending=False, kind='stable')
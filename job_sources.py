@@ -0,0 +1,201 @@
+"""
+Job source adapters for LinkedIn, Indeed and AngelList
+Each adapter pages through its search endpoint and lazily yields normalized job dicts
+"""
+
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+import requests
+
+from html_parsing import completed_future, parse_html
+
+
+class SourceAdapter(ABC):
+    """Base adapter: fetch pages one at a time and yield normalized jobs as they arrive"""
+
+    name = 'Source'
+    page_param = 'start'
+    page_size = 25
+    parser = None  # html_parsing parser name for pages that can be parsed in a worker process
+
+    def __init__(self, search_url, params, max_pages=3, min_interval=2.0, timeout=15):
+        self.search_url = search_url
+        self.params = dict(params)
+        self.max_pages = max_pages
+        self.min_interval = min_interval
+        self.timeout = timeout
+        # Set when paging stopped on a fetch error rather than an empty page, so the results are partial
+        self.failed = False
+        self._last_request = 0.0
+
+    def page_params(self, page_index):
+        """Query parameters for the given zero-based page"""
+        params = dict(self.params)
+        start = params.get(self.page_param, 0) or 0
+        params[self.page_param] = int(start) + page_index * self.page_size
+        return params
+
+    def fetch_page(self, session, page_index):
+        """Fetch one search page, honoring the per-source rate limit (session may be a ResilientTransport)"""
+        wait = self.min_interval - (time.monotonic() - self._last_request)
+        if wait > 0:
+            time.sleep(wait)
+        self._last_request = time.monotonic()
+
+        response = session.get(self.search_url, params=self.page_params(page_index), timeout=self.timeout)
+        response.raise_for_status()
+        return response
+
+    @abstractmethod
+    def parse_page(self, response):
+        """Extract raw job dicts from a search page"""
+
+    def submit_parse(self, parse_pool, response):
+        """Future of the page's raw jobs: parsed in the pool when there is one, otherwise right here"""
+        if parse_pool is not None and self.parser:
+            return parse_pool.submit(self.parser, response.text, response.url)
+        return completed_future(self.parse_page, response)
+
+    def normalize(self, raw):
+        """Map a raw job dict onto the scraper's job schema"""
+        return {
+            'company_name': (raw.get('company') or '').strip(),
+            'offered_position': (raw.get('title') or '').strip(),
+            'direct_apply_link': (raw.get('link') or '').strip(),
+            'job_description': (raw.get('description') or '').strip(),
+            'hr_email': (raw.get('email') or '').strip(),
+            'location': (raw.get('location') or '').strip(),
+            'posted_date': (raw.get('posted') or '').strip(),
+            'scraped_at': datetime.now().isoformat(),
+            'source': self.name
+        }
+
+    def iter_jobs(self, session, parse_pool=None):
+        """Yield normalized jobs page by page until a page comes back empty
+
+        With a parse pool, page N is parsed in a worker process while page N+1 downloads.
+        """
+        pending = None
+        for page_index in range(self.max_pages):
+            if pending is not None and pending[1].done():
+                if not (yield from self._emit_page(*pending)):
+                    return
+                pending = None
+
+            try:
+                response = self.fetch_page(session, page_index)
+            except requests.RequestException as e:
+                print(f"⚠️ {self.name}: stopped at page {page_index + 1} ({e})")
+                self.failed = True
+                break
+            future = self.submit_parse(parse_pool, response)
+
+            if pending is not None and not (yield from self._emit_page(*pending)):
+                future.cancel()
+                return
+            pending = (page_index, future)
+
+        if pending is not None:
+            yield from self._emit_page(*pending)
+
+    def _emit_page(self, page_index, future):
+        """Yield one parsed page's jobs; returns False when paging should stop"""
+        try:
+            raw_jobs = future.result()
+        except Exception as e:
+            # A page whose layout changed is skipped; the next page may still parse
+            print(f"⚠️ {self.name}: skipped unparseable page {page_index + 1} ({type(e).__name__}: {e})")
+            return True
+
+        if not raw_jobs:
+            return False
+
+        for raw in raw_jobs:
+            job = self.normalize(raw)
+            if job['company_name'] and job['offered_position'] and job['direct_apply_link']:
+                yield job
+        return True
+
+
+class HtmlSourceAdapter(SourceAdapter):
+    """Adapter for HTML result pages parsed by an html_parsing parser"""
+
+    def parse_page(self, response):
+        return parse_html(self.parser, response.text, response.url)
+
+
+class LinkedInAdapter(HtmlSourceAdapter):
+    """LinkedIn guest jobs API (HTML job cards, paged by `start`)"""
+
+    name = 'LinkedIn'
+    page_param = 'start'
+    page_size = 25
+    parser = 'linkedin'
+
+
+class IndeedAdapter(HtmlSourceAdapter):
+    """Indeed search results (HTML result cards, paged by `start` in steps of 10)"""
+
+    name = 'Indeed'
+    page_param = 'start'
+    page_size = 10
+    parser = 'indeed'
+
+
+class AngelListAdapter(SourceAdapter):
+    """AngelList jobs API (JSON, paged by `page` starting at 1)"""
+
+    name = 'AngelList'
+    page_param = 'page'
+    page_size = 1
+
+    def page_params(self, page_index):
+        params = dict(self.params)
+        params[self.page_param] = int(params.get(self.page_param, 1) or 1) + page_index
+        return params
+
+    def parse_page(self, response):
+        payload = response.json()
+        jobs = []
+        for item in payload.get('jobs', []):
+            company = item.get('company') or {}
+            jobs.append({
+                'title': item.get('title', ''),
+                'company': company.get('name', '') if isinstance(company, dict) else str(company),
+                'link': item.get('url') or item.get('apply_url', ''),
+                'description': item.get('description', ''),
+                'email': item.get('contact_email', '')
+            })
+        return jobs
+
+
+ADAPTERS = {
+    'LinkedIn': LinkedInAdapter,
+    'Indeed': IndeedAdapter,
+    'AngelList': AngelListAdapter
+}
+
+
+def build_adapters(job_sources):
+    """Create one adapter per configured entry in job_sources"""
+    adapters = []
+    for name, config in job_sources.items():
+        adapter_class = ADAPTERS.get(name)
+        if adapter_class is None:
+            print(f"⚠️ No adapter for source '{name}', skipping")
+            continue
+        adapters.append(adapter_class(
+            config['search_url'],
+            config.get('params', {}),
+            max_pages=config.get('max_pages', 3),
+            min_interval=config.get('min_interval', 2.0)
+        ))
+    return adapters
+
+
+def iter_source_jobs(session, adapters, parse_pool=None):
+    """Chain all adapters into one lazy stream of normalized jobs"""
+    for adapter in adapters:
+        yield from adapter.iter_jobs(session, parse_pool)
@@ -0,0 +1,192 @@
+"""
+Job data storage formats
+Writes and reads job tables as CSV, Parquet or Feather with typed columns
+"""
+
+import os
+from importlib.util import find_spec
+
+# format -> (file extension, default compression)
+FORMATS = {
+    'csv': ('.csv', None),
+    'parquet': ('.parquet', 'snappy'),
+    'feather': ('.feather', 'zstd')
+}
+
+TEXT_COLUMNS = ['offered_position', 'direct_apply_link', 'job_description', 'hr_email']
+
+
+def columnar_available():
+    """Check if pyarrow is installed for Parquet/Feather support"""
+    # find_spec avoids paying for the pyarrow import until a columnar file is actually written
+    return find_spec('pyarrow') is not None
+
+
+def resolve_format(fmt):
+    """Validate an output format, falling back to CSV when pyarrow is missing"""
+    fmt = (fmt or 'csv').lower()
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown output format '{fmt}' (choose from {', '.join(FORMATS)})")
+    if fmt != 'csv' and not columnar_available():
+        print(f"⚠️ pyarrow is not installed, saving as CSV instead of {fmt}")
+        return 'csv'
+    return fmt
+
+
+def format_of(path):
+    """Infer the storage format from a file extension"""
+    ext = os.path.splitext(path)[1].lower()
+    for fmt, (fmt_ext, _) in FORMATS.items():
+        if ext == fmt_ext:
+            return fmt
+    raise ValueError(f"Unknown job file type: {path}")
+
+
+def apply_types(df):
+    """Give job columns proper dtypes (datetime scraped_at, categorical company_name)"""
+    import pandas as pd
+
+    df = df.copy()
+    if 'scraped_at' in df.columns and not pd.api.types.is_datetime64_any_dtype(df['scraped_at']):
+        df['scraped_at'] = pd.to_datetime(df['scraped_at'], errors='coerce', format='ISO8601')
+    if 'company_name' in df.columns:
+        df['company_name'] = df['company_name'].astype('category')
+    for col in TEXT_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].fillna('').astype('string')
+    return df
+
+
+def write_jobs(df, path_base, fmt='csv', compression=None):
+    """Write a job table to path_base + format extension and return the full path"""
+    ext, default_compression = FORMATS[fmt]
+    path = path_base + ext
+    compression = compression or default_compression
+
+    if fmt == 'csv':
+        df.to_csv(path, index=False, encoding='utf-8')
+    elif fmt == 'parquet':
+        apply_types(df).to_parquet(path, index=False, compression=compression)
+    else:
+        apply_types(df).reset_index(drop=True).to_feather(path, compression=compression)
+    return path
+
+
+def read_jobs(path, columns=None):
+    """Read a job table, loading only the requested columns"""
+    import pandas as pd
+
+    fmt = format_of(path)
+    if fmt == 'csv':
+        usecols = (lambda col: col in columns) if columns else None
+        return apply_types(pd.read_csv(path, usecols=usecols))
+    if fmt == 'parquet':
+        return pd.read_parquet(path, columns=columns)
+    return pd.read_feather(path, columns=columns)
+
+
+FILTER_COLUMNS = {
+    'company': ['company_name'],
+    'since': ['scraped_at'],
+    'until': ['scraped_at'],
+    'keyword': ['offered_position', 'job_description'],
+    'min_ppo': ['ppo_lpa', 'job_description'],
+    'min_score': ['relevance_score']
+}
+
+
+def filter_jobs(df, company=None, since=None, until=None, keyword=None, min_ppo=None, min_score=None):
+    """Rows matching every given filter (company/keyword are case-insensitive substrings, dates inclusive)"""
+    import pandas as pd
+
+    mask = pd.Series(True, index=df.index)
+    if company:
+        mask &= df['company_name'].astype(str).str.contains(company, case=False, regex=False, na=False)
+    if since is not None:
+        mask &= df['scraped_at'] >= pd.Timestamp(since)
+    if until is not None:
+        mask &= df['scraped_at'] <= pd.Timestamp(until)
+    if keyword:
+        text = df['offered_position'].fillna('').astype(str) + ' ' + df['job_description'].fillna('').astype(str)
+        mask &= text.str.contains(keyword, case=False, regex=False, na=False)
+    if min_ppo is not None:
+        if 'ppo_lpa' in df.columns:
+            ppo = df['ppo_lpa']
+        else:
+            # Files written before scoring existed: extract the amount on the fly
+            from job_scoring import PPO_RE
+            ppo = pd.to_numeric(df['job_description'].fillna('').astype(str).str.extract(PPO_RE, expand=False),
+                                errors='coerce')
+        mask &= ppo.fillna(0) >= min_ppo
+    if min_score is not None:
+        # Files written before scoring existed have no score and count as 0
+        score = df['relevance_score'] if 'relevance_score' in df.columns else pd.Series(0.0, index=df.index)
+        mask &= pd.to_numeric(score, errors='coerce').fillna(0) >= min_score
+    return df[mask.to_numpy()]
+
+
+def _parquet_filters(path, since=None, until=None, min_ppo=None, min_score=None, **_):
+    """Row-group filters pyarrow can apply while reading, for columns present in the file"""
+    import pandas as pd
+    import pyarrow.parquet as pq
+
+    names = set(pq.read_schema(path).names)
+    filters = []
+    if 'scraped_at' in names:
+        if since is not None:
+            filters.append(('scraped_at', '>=', pd.Timestamp(since).to_pydatetime()))
+        if until is not None:
+            filters.append(('scraped_at', '<=', pd.Timestamp(until).to_pydatetime()))
+    if min_ppo is not None and 'ppo_lpa' in names:
+        filters.append(('ppo_lpa', '>=', float(min_ppo)))
+    if min_score is not None and 'relevance_score' in names:
+        filters.append(('relevance_score', '>=', float(min_score)))
+    return filters or None
+
+
+def scan_jobs(path, columns=None, filters=None, chunksize=50000, max_rows=None):
+    """Read only the rows matching filters, loading just the needed columns
+
+    Parquet pushes date and PPO filters into the reader; CSV is scanned in chunks so memory stays
+    bounded by the matches, and scanning stops once max_rows matches have been collected.
+    """
+    import pandas as pd
+
+    filters = {key: value for key, value in (filters or {}).items() if value not in (None, '')}
+    needed = None
+    if columns:
+        needed = list(columns)
+        for key in filters:
+            needed += [col for col in FILTER_COLUMNS[key] if col not in needed]
+
+    fmt = format_of(path)
+    if fmt == 'parquet':
+        import pyarrow.parquet as pq
+
+        available = pq.read_schema(path).names
+        needed = [col for col in needed if col in available] if needed else None
+        df = apply_types(pd.read_parquet(path, columns=needed, filters=_parquet_filters(path, **filters)))
+        df = filter_jobs(df, **filters)
+    elif fmt == 'feather':
+        import pyarrow.feather as feather
+
+        # Memory-mapped, so only the selected columns are materialized
+        table = feather.read_table(path, memory_map=True)
+        if needed:
+            table = table.select([col for col in needed if col in table.column_names])
+        df = filter_jobs(apply_types(table.to_pandas()), **filters)
+    else:
+        usecols = (lambda col: col in needed) if needed else None
+        matches = []
+        found = 0
+        for chunk in pd.read_csv(path, usecols=usecols, chunksize=chunksize):
+            chunk = filter_jobs(apply_types(chunk), **filters)
+            matches.append(chunk)
+            found += len(chunk)
+            if max_rows is not None and found >= max_rows:
+                break
+        df = apply_types(pd.concat(matches, ignore_index=True) if matches else pd.DataFrame(columns=needed or []))
+
+    if max_rows is not None:
+        df = df.iloc[:max_rows]
+    return df[[col for col in columns if col in df.columns]] if columns else df
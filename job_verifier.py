@@ -0,0 +1,152 @@
+"""
+Concurrent job-status verification
+Runs verify_job_status over many postings with global and per-host limits and an overall deadline
+"""
+
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from urllib.parse import urlsplit
+
+DEADLINE_RESULT = (False, "Error: verification deadline exceeded")
+
+# Status prefix for postings kept because a transient failure prevented a real check
+UNVERIFIED_PREFIX = "Unverified"
+
+
+class ConcurrentVerifier:
+    def __init__(self, verify_func, max_workers=16, per_host_limit=4, deadline=300.0, max_buffered=None):
+        self.verify_func = verify_func
+        self.max_workers = max(1, int(max_workers))
+        self.per_host_limit = max(1, int(per_host_limit))
+        self.deadline = deadline
+        # Upper bound on postings pulled from the input but not yet yielded
+        self.max_buffered = max_buffered or self.max_workers * 4
+        self.last_stats = {}
+
+    @staticmethod
+    def host_of(url):
+        """Get the lowercase host of a URL"""
+        try:
+            return urlsplit(url).hostname or ''
+        except ValueError:
+            return ''
+
+    def verify_all(self, urls):
+        """Verify all URLs and return (is_open, status_msg) tuples in input order"""
+        urls = list(urls)
+        results = [DEADLINE_RESULT] * len(urls)
+        for (index, _), result in self.iter_verify(enumerate(urls), url_of=lambda pair: pair[1]):
+            results[index] = result
+        # URLs never read from the input before the deadline also missed it
+        self.last_stats['timed_out'] += len(urls) - self.last_stats['urls']
+        self.last_stats['urls'] = len(urls)
+        return results
+
+    def iter_verify(self, items, url_of=None, precheck=None):
+        """Lazily verify items from any iterable, yielding (item, (is_open, status_msg)) as verifications complete
+
+        Each item is submitted as soon as it is pulled, so verification overlaps a slow streaming
+        source, and at most max_buffered items are pulled but not yet yielded. Results come back in
+        completion order, so a slow host never holds up postings behind it. Once the deadline passes,
+        items still queued or in flight are yielded with a deadline result and the input is not read
+        any further. precheck(item) may return a known result to skip the request for that item.
+        """
+        url_of = url_of or (lambda item: item)
+        source = iter(items)
+        started = time.monotonic()
+        counts = {'urls': 0, 'verified': 0, 'timed_out': 0, 'skipped': 0}
+        hosts = set()
+
+        pending = {}         # host -> deque of (item, url) not yet submitted
+        in_flight = {}       # future -> (item, host)
+        host_active = {}
+        outstanding = 0      # pulled but not yet yielded
+        exhausted = False
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            while True:
+                remaining = None
+                if self.deadline is not None:
+                    remaining = self.deadline - (time.monotonic() - started)
+                    if remaining <= 0:
+                        break
+
+                # Pull one item at a time and submit it right away
+                if not exhausted and outstanding < self.max_buffered:
+                    try:
+                        item = next(source)
+                    except StopIteration:
+                        exhausted = True
+                    else:
+                        url = url_of(item)
+                        host = self.host_of(url)
+                        hosts.add(host)
+                        known = precheck(item) if precheck else None
+                        if known is not None:
+                            counts['skipped'] += 1
+                            counts['urls'] += 1
+                            yield item, known
+                            continue
+                        pending.setdefault(host, deque()).append((item, url))
+                        outstanding += 1
+                        self._dispatch(executor, pending, in_flight, host_active)
+
+                if exhausted and not outstanding:
+                    break
+
+                # Only block when nothing more may be pulled; otherwise just collect what has finished
+                blocking = exhausted or outstanding >= self.max_buffered
+                done, _ = wait(list(in_flight), timeout=remaining if blocking else 0, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item, host = in_flight.pop(future)
+                    host_active[host] -= 1
+                    outstanding -= 1
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = (False, f"Error: {str(e)}")
+                    counts['verified'] += 1
+                    counts['urls'] += 1
+                    yield item, result
+                if done:
+                    self._dispatch(executor, pending, in_flight, host_active)
+
+            # Deadline passed: everything still queued or in flight missed it
+            leftovers = [item for item, _ in in_flight.values()]
+            leftovers += [item for queue in pending.values() for item, _ in queue]
+            in_flight.clear()
+            pending.clear()
+            for item in leftovers:
+                counts['timed_out'] += 1
+                counts['urls'] += 1
+                yield item, DEADLINE_RESULT
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            elapsed = time.monotonic() - started
+            self.last_stats = {
+                'urls': counts['urls'],
+                'verified': counts['verified'],
+                'hosts': len(hosts),
+                'elapsed_seconds': round(elapsed, 3),
+                # Only completed verifications count towards throughput, never deadline misses
+                'urls_per_second': round(counts['verified'] / elapsed, 2) if elapsed > 0 else float(counts['verified']),
+                'timed_out': counts['timed_out'],
+                'skipped': counts['skipped'],
+            }
+
+    def _dispatch(self, executor, pending, in_flight, host_active):
+        """Submit queued URLs while global and per-host capacity allows"""
+        for host in list(pending):
+            queue = pending[host]
+            while (queue and len(in_flight) < self.max_workers
+                   and host_active.get(host, 0) < self.per_host_limit):
+                item, url = queue.popleft()
+                future = executor.submit(self.verify_func, url)
+                in_flight[future] = (item, host)
+                host_active[host] = host_active.get(host, 0) + 1
+            if not queue:
+                del pending[host]
+            if len(in_flight) >= self.max_workers:
+                break
@@ -0,0 +1,107 @@
+"""
+Job scraper command line
+One entry point for scrape, verify, view, publish and daemon; each subcommand imports only the modules it needs
+"""
+
+import argparse
+import importlib
+import sys
+
+# Modules a subcommand loads before doing any work (what check_import_time.py measures)
+COMMAND_MODULES = {
+    'scrape': ['real_job_scraper'],
+    'verify': ['real_job_scraper'],
+    'view': ['display_real_jobs'],
+    'publish': ['publish_queue'],
+    'daemon': ['scraper_daemon']
+}
+
+# Subcommands whose options belong to an existing script's own parser
+DELEGATED = {'view': 'display_real_jobs', 'publish': 'publish_queue', 'daemon': 'scraper_daemon'}
+
+
+def import_command(name):
+    """Import everything a subcommand needs, without running it"""
+    return [importlib.import_module(module) for module in COMMAND_MODULES[name]]
+
+
+def run_scrape(args):
+    from real_job_scraper import RealJobScraper
+
+    publisher = None
+    if args.publish:
+        from publish_queue import PublishQueue
+        publisher = PublishQueue(batch_window=args.publish_window)
+
+    scraper = RealJobScraper(output_format=args.format, min_relevance=args.min_relevance,
+                             use_live_sources=not args.no_live, publisher=publisher)
+    try:
+        scraper.run_real_scraper(profile_path=args.profile, trace_memory=args.trace_memory)
+    finally:
+        if publisher:
+            publisher.close()
+        scraper.close()
+    return 0
+
+
+def run_verify(args):
+    from real_job_scraper import RealJobScraper
+
+    scraper = RealJobScraper(cache_path=None if args.no_cache else 'data/verification_cache.sqlite',
+                             seen_index_path=None, head_first=not args.get_only)
+    closed = 0
+    try:
+        for url in args.urls:
+            is_open, status_msg, tier = scraper.verify_with_tier(url)
+            print(f"{'✅ OPEN' if is_open else '❌ CLOSED'} [{tier}] {url} ({status_msg})")
+            closed += not is_open
+    finally:
+        scraper.close()
+    return 1 if closed else 0
+
+
+def run_delegated(args, extra):
+    module = importlib.import_module(DELEGATED[args.command])
+    return module.main(extra) or 0
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog='jobs_cli.py', description='Fintech job scraper')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    scrape = commands.add_parser('scrape', help='Run one full scrape and save the results')
+    scrape.add_argument('--format', default='csv', choices=['csv', 'parquet', 'feather'])
+    scrape.add_argument('--min-relevance', type=float, help='Drop postings scoring below this')
+    scrape.add_argument('--no-live', action='store_true', help='Only verify the curated postings')
+    scrape.add_argument('--publish', action='store_true', help='Commit and push the run\'s delta in the background')
+    scrape.add_argument('--publish-window', type=float, default=0, help='Seconds of runs coalesced per commit')
+    scrape.add_argument('--profile', metavar='PATH', help='Save cProfile stats for the run')
+    scrape.add_argument('--trace-memory', action='store_true', help='Report the largest allocations')
+    scrape.set_defaults(handler=run_scrape)
+
+    verify = commands.add_parser('verify', help='Check whether job posting URLs are still open')
+    verify.add_argument('urls', nargs='+', metavar='URL')
+    verify.add_argument('--no-cache', action='store_true', help='Ignore the verification cache')
+    verify.add_argument('--get-only', action='store_true', help='Skip the HEAD triage tier')
+    verify.set_defaults(handler=run_verify)
+
+    # Options are parsed by the script itself, so `view --help` shows the viewer's flags
+    commands.add_parser('view', add_help=False, help='Browse saved jobs (see display_real_jobs.py --help)')
+    commands.add_parser('publish', add_help=False, help='Publish runs left pending (see publish_queue.py --help)')
+    commands.add_parser('daemon', add_help=False, help='Run the scheduler (see scraper_daemon.py --help)')
+
+    return parser.parse_known_args(argv)
+
+
+def main(argv=None):
+    args, extra = parse_args(argv)
+    if args.command in DELEGATED:
+        return run_delegated(args, extra)
+    if extra:
+        print(f"❌ Unrecognized arguments: {' '.join(extra)}", file=sys.stderr)
+        return 2
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    exit(main())
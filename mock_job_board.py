@@ -0,0 +1,208 @@
+"""
+Local HTTP stand-in for job boards
+Serves recorded HTML/JSON search pages from fixtures/ so source adapters can run without the network,
+plus synthetic career pages with configurable latency, size, open/closed markers, errors and redirects
+"""
+
+import os
+import random
+import threading
+import time
+import zlib
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# path -> (fixture folder, page query parameter, page size, first page value, file extension, content type)
+FIXTURE_ROUTES = {
+    '/linkedin': ('linkedin', 'start', 25, 0, 'html', 'text/html; charset=utf-8'),
+    '/indeed': ('indeed', 'start', 10, 0, 'html', 'text/html; charset=utf-8'),
+    '/angellist': ('angellist', 'page', 1, 1, 'json', 'application/json')
+}
+
+# Career page behaviour; ratios are per posting (stable), rates are per request (random)
+CAREER_DEFAULTS = {
+    'latency': 0.0,          # seconds before each career page response
+    'body_size': 20 * 1024,  # bytes of page body
+    'closed_ratio': 0.2,     # share of postings whose page says applications are closed
+    'redirect_ratio': 0.1,   # share of postings served through one 302 hop
+    'gone_ratio': 0.0,       # share of postings answering 410 Gone
+    'landing_ratio': 0.0,    # share of postings redirecting to the generic /careers/ landing page
+    'rate_limit_rate': 0.0,  # chance of a 429 (with Retry-After)
+    'error_rate': 0.0,       # chance of a 503
+    'retry_after': 1,
+    'seed': 0
+}
+
+# Building blocks for synthetic postings; combined per posting so titles and descriptions differ
+ROLES = ['Backend Engineer', 'Android Developer', 'Full Stack Developer', 'iOS Developer', 'SDE Intern',
+         'Platform Engineer', 'Data Engineer', 'Frontend Developer', 'Site Reliability Engineer', 'QA Automation Engineer']
+TEAMS = ['Payments', 'Lending', 'Risk', 'Onboarding', 'Ledger', 'Fraud', 'Wealth', 'Cards', 'Insurance', 'Growth', 'Compliance']
+STACKS = ['Go and PostgreSQL', 'Kotlin and Jetpack Compose', 'React and Node.js', 'Swift and SwiftUI', 'Java and Spring Boot',
+          'Python and Kafka', 'Scala and Spark', 'TypeScript and Next.js', 'Rust and gRPC', 'Elixir and Redis', 'C++ and Linux',
+          'Terraform and Kubernetes', 'Flutter and Firebase']
+
+OPEN_MARKER = 'Apply now for this role. Submit application below.'
+CLOSED_MARKER = 'We are no longer accepting applications for this position.'
+
+
+class MockJobBoard:
+    """Run a fixture server on a free local port (usable as a context manager)"""
+
+    def __init__(self, fixtures_dir=FIXTURES_DIR, host='127.0.0.1', port=0, **career_options):
+        self.fixtures_dir = fixtures_dir
+        self.requests = []
+        self.career = {**CAREER_DEFAULTS, **career_options}
+        self._random = random.Random(self.career['seed'])
+        self._random_lock = threading.Lock()
+        board = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                self.reply(send_body=True)
+
+            def do_HEAD(self):
+                self.reply(send_body=False)
+
+            def reply(self, send_body):
+                board.requests.append(self.path)
+                response = board.respond(self.path, self.headers)
+                status, content_type, body = response[:3]
+                headers = response[3] if len(response) > 3 else {}
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                if send_body:
+                    self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def respond(self, path, request_headers=None):
+        """Map a request path to (status, content type, body[, headers]) from the fixture files"""
+        parts = urlsplit(path)
+        if parts.path.startswith('/careers/'):
+            return self.career_page(parts, request_headers or {})
+        route = FIXTURE_ROUTES.get(parts.path)
+        if route is None:
+            return 404, 'text/plain', b'not found'
+
+        folder, page_param, page_size, first_page, ext, content_type = route
+        query = parse_qs(parts.query)
+        try:
+            value = int(query.get(page_param, [first_page])[0])
+        except ValueError:
+            return 400, 'text/plain', b'bad page'
+
+        page_index = (value - first_page) // page_size
+        fixture = os.path.join(self.fixtures_dir, folder, f'page_{page_index + first_page}.{ext}')
+        if not os.path.exists(fixture):
+            return 200, content_type, b'{"jobs": []}' if ext == 'json' else b''
+
+        with open(fixture, 'rb') as f:
+            return 200, content_type, f.read()
+
+    def _posting_draw(self, posting_id, salt):
+        """Stable pseudo-random number in [0, 1) for a posting"""
+        return zlib.crc32(f'{self.career["seed"]}:{salt}:{posting_id}'.encode('utf-8')) / 2 ** 32
+
+    def is_closed(self, posting_id):
+        return self._posting_draw(posting_id, 'closed') < self.career['closed_ratio']
+
+    def career_page(self, parts, request_headers):
+        """Synthetic career page: latency, then maybe a 429/503, 410 or redirect, then a padded open/closed page"""
+        options = self.career
+        posting_id = parts.path.rsplit('/', 1)[-1]
+        if options['latency']:
+            time.sleep(options['latency'])
+        if not posting_id:
+            return 200, 'text/html; charset=utf-8', b'<html><body><h1>Careers</h1><p>Explore open roles</p></body></html>'
+
+        with self._random_lock:
+            draw = self._random.random()
+        if draw < options['rate_limit_rate']:
+            return 429, 'text/plain', b'slow down', {'Retry-After': str(options['retry_after'])}
+        if draw < options['rate_limit_rate'] + options['error_rate']:
+            return 503, 'text/plain', b'unavailable'
+
+        if self._posting_draw(posting_id, 'gone') < options['gone_ratio']:
+            return 410, 'text/plain', b'gone'
+        if self._posting_draw(posting_id, 'landing') < options['landing_ratio']:
+            return 302, 'text/plain', b'', {'Location': '/careers/'}
+        if 'hop' not in parts.query and self._posting_draw(posting_id, 'redirect') < options['redirect_ratio']:
+            return 302, 'text/plain', b'', {'Location': f'{parts.path}?hop=1'}
+
+        closed = self.is_closed(posting_id)
+        etag = f'"{posting_id}-{int(closed)}"'
+        if request_headers.get('If-None-Match') == etag:
+            return 304, 'text/html; charset=utf-8', b'', {'ETag': etag}
+
+        marker = CLOSED_MARKER if closed else OPEN_MARKER
+        head = f'<html><head><title>Job {posting_id}</title></head><body><h1>Software Engineer</h1><p>'
+        tail = f'</p><div class="status">{marker}</div></body></html>'
+        padding = 'x' * max(0, options['body_size'] - len(head) - len(tail))
+        return 200, 'text/html; charset=utf-8', (head + padding + tail).encode('utf-8'), {'ETag': etag}
+
+    def career_url(self, posting_id, company='Company'):
+        """Career page URL for a posting"""
+        return f"{self.base_url}/careers/{company.lower()}-{posting_id}"
+
+    def career_jobs(self, count, companies=('Razorpay', 'PhonePe', 'CRED', 'Zerodha', 'Groww')):
+        """Job dicts whose apply links point at this server's career pages"""
+        now = time.strftime('%Y-%m-%dT%H:%M:%S')
+        jobs = []
+        for i in range(count):
+            company = companies[i % len(companies)]
+            role, team, stack = ROLES[i % len(ROLES)], TEAMS[i % len(TEAMS)], STACKS[i % len(STACKS)]
+            jobs.append({
+                'company_name': company,
+                'offered_position': f'{role}, {team} (Req {i})',
+                'direct_apply_link': self.career_url(i, company),
+                'job_description': f'Join the {team} team at {company} building {stack} services. Requisition {i} '
+                                   f'ships {team.lower()} features with {stack}. Remote work available. '
+                                   f'PPO up to {10 + i % 30} LPA.',
+                'hr_email': f'careers@{company.lower()}.com',
+                'scraped_at': now
+            })
+        return jobs
+
+    def job_sources(self, **overrides):
+        """Build a job_sources mapping that points every adapter at this server"""
+        sources = {
+            'LinkedIn': {'search_url': f'{self.base_url}/linkedin', 'params': {'start': 0}},
+            'Indeed': {'search_url': f'{self.base_url}/indeed', 'params': {}},
+            'AngelList': {'search_url': f'{self.base_url}/angellist', 'params': {'page': 1}}
+        }
+        for config in sources.values():
+            config.update({'max_pages': 5, 'min_interval': 0})
+            config.update(overrides)
+        return sources
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,119 @@
+"""
+Streaming job page classifier
+Matches all open/closed indicators in one pass over the response body and stops as soon as a closed indicator is seen
+"""
+
+import codecs
+import re
+from urllib.parse import urlsplit
+
+# Check for closed position indicators
+CLOSED_INDICATORS = [
+    'no longer accepting applications',
+    'position is closed',
+    'application closed',
+    'expired',
+    'no longer available',
+    'position filled',
+    'hiring complete',
+    'applications are closed',
+    'this job is no longer available',
+    'position has been filled',
+    'closed position'
+]
+
+# Check for open position indicators
+OPEN_INDICATORS = [
+    'apply now',
+    'easy apply',
+    'save job',
+    'application form',
+    'submit application',
+    'apply for this job',
+    'click to apply',
+    'job application',
+    'apply today'
+]
+
+_CLOSED_SET = frozenset(CLOSED_INDICATORS)
+
+# Zero-width lookahead so overlapping indicators (e.g. "job application closed") are all seen in one scan;
+# longest alternatives first so a closed phrase wins over a shorter one starting at the same offset
+_INDICATOR_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(i) for i in sorted(CLOSED_INDICATORS + OPEN_INDICATORS, key=len, reverse=True)) + '))'
+)
+_OVERLAP = max(len(i) for i in CLOSED_INDICATORS + OPEN_INDICATORS) - 1
+
+CHUNK_SIZE = 16 * 1024
+MAX_BYTES = 2 * 1024 * 1024
+
+
+def classify_text_chunks(chunks):
+    """Classify lowercase-able text chunks; returns (is_open, status_msg)"""
+    tail = ''
+    open_found = False
+
+    for chunk in chunks:
+        window = tail + chunk.lower()
+        for match in _INDICATOR_RE.finditer(window):
+            indicator = match.group(1)
+            if indicator in _CLOSED_SET:
+                return False, f"Closed: {indicator}"
+            open_found = True
+        tail = window[-_OVERLAP:] if _OVERLAP else ''
+
+    if open_found:
+        return True, "Open - Accepting applications"
+
+    # If no clear indicators found, assume it's open if page loads successfully
+    return True, "Likely open - Page accessible"
+
+
+def iter_decoded(response, chunk_size=CHUNK_SIZE, max_bytes=MAX_BYTES):
+    """Yield decoded text chunks from a streamed response, reading at most max_bytes"""
+    decoder = codecs.getincrementaldecoder(_codec_name(response.encoding))(errors='replace')
+    read = 0
+    for raw in response.iter_content(chunk_size=chunk_size):
+        if max_bytes is not None and read + len(raw) > max_bytes:
+            raw = raw[:max_bytes - read]
+        read += len(raw)
+        if raw:
+            yield decoder.decode(raw)
+        if max_bytes is not None and read >= max_bytes:
+            break
+    yield decoder.decode(b'', final=True)
+
+
+# Where boards send visitors of removed postings: the careers home page or an explicit "closed" page
+GONE_STATUSES = {404, 410}
+_LANDING_PATH_RE = re.compile(
+    r'^(?:[a-z]{2}(?:[-_][a-z]{2})?/)*(?:jobs?|careers?|openings|positions|job-search|search|jobs/search)?$'
+)
+_CLOSED_REDIRECT_RE = re.compile(r'expired|closed|no-?longer|not-?found|job-?unavailable')
+
+
+def is_generic_landing(original_url, final_url):
+    """Check if a redirect took a posting URL to a generic careers landing or "job closed" page"""
+    original, final = urlsplit(original_url), urlsplit(final_url)
+    final_path = final.path.strip('/').lower()
+    if final_path == original.path.strip('/').lower() and final.netloc == original.netloc:
+        return False
+    return bool(_LANDING_PATH_RE.match(final_path) or _CLOSED_REDIRECT_RE.search(f'{final_path}?{final.query.lower()}'))
+
+
+def classify_response(response, chunk_size=CHUNK_SIZE, max_bytes=MAX_BYTES):
+    """Classify a response opened with stream=True and release its connection"""
+    try:
+        if response.status_code != 200:
+            return False, f"HTTP {response.status_code}"
+        return classify_text_chunks(iter_decoded(response, chunk_size, max_bytes))
+    finally:
+        response.close()
+
+
+def _codec_name(encoding):
+    """Resolve a response encoding to a usable codec name"""
+    try:
+        return codecs.lookup(encoding or 'utf-8').name
+    except LookupError:
+        return 'utf-8'
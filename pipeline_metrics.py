@@ -0,0 +1,168 @@
+"""
+Scraper pipeline instrumentation
+Stage timers, per-host latency and response-size histograms, counters, JSON/Prometheus run reports and optional profiling
+"""
+
+import bisect
+import io
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+LATENCY_BUCKETS = [0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 15.0, 30.0]
+SIZE_BUCKETS = [1024, 10 * 1024, 50 * 1024, 100 * 1024, 500 * 1024, 1024 * 1024, 2 * 1024 * 1024, 5 * 1024 * 1024]
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus style"""
+
+    def __init__(self, buckets):
+        self.buckets = list(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def to_dict(self):
+        cumulative = []
+        running = 0
+        for bound, count in zip(self.buckets + ['+Inf'], self.counts):
+            running += count
+            cumulative.append([bound, running])
+        return {'count': self.count, 'sum': round(self.total, 6), 'buckets': cumulative}
+
+
+class PipelineMetrics:
+    def __init__(self):
+        self.stages = {}
+        self.counters = {}
+        self.latency = {}
+        self.response_size = {}
+        self.started_at = datetime.now().isoformat()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name):
+        """Time a pipeline stage; repeated stages accumulate"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_stage_time(name, time.perf_counter() - started)
+
+    def add_stage_time(self, name, seconds):
+        with self._lock:
+            self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def timed_iter(self, iterable, name):
+        """Wrap an iterator so the time spent producing items is charged to a stage"""
+        iterator = iter(iterable)
+        while True:
+            started = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.add_stage_time(name, time.perf_counter() - started)
+                return
+            self.add_stage_time(name, time.perf_counter() - started)
+            yield item
+
+    def inc(self, name, amount=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def observe_request(self, host, seconds, size=None):
+        """Record one HTTP request's latency (and body size when known) for a host"""
+        with self._lock:
+            self.latency.setdefault(host, Histogram(LATENCY_BUCKETS)).observe(seconds)
+            if size is not None:
+                self.response_size.setdefault(host, Histogram(SIZE_BUCKETS)).observe(size)
+
+    def report(self):
+        """Machine-readable run report"""
+        with self._lock:
+            return {
+                'started_at': self.started_at,
+                'finished_at': datetime.now().isoformat(),
+                'stages_seconds': {name: round(value, 6) for name, value in self.stages.items()},
+                'counters': dict(self.counters),
+                'request_latency_seconds': {host: h.to_dict() for host, h in self.latency.items()},
+                'response_size_bytes': {host: h.to_dict() for host, h in self.response_size.items()},
+            }
+
+    def prometheus_text(self):
+        """Render metrics in the Prometheus text exposition format"""
+        report = self.report()
+        lines = [
+            '# HELP scraper_stage_seconds Wall-clock time spent in each pipeline stage',
+            '# TYPE scraper_stage_seconds gauge'
+        ]
+        for name, value in report['stages_seconds'].items():
+            lines.append(f'scraper_stage_seconds{{stage="{name}"}} {value}')
+
+        lines += ['# HELP scraper_events_total Pipeline event counters', '# TYPE scraper_events_total counter']
+        for name, value in report['counters'].items():
+            lines.append(f'scraper_events_total{{event="{name}"}} {value}')
+
+        for metric, key, help_text in [
+            ('scraper_request_latency_seconds', 'request_latency_seconds', 'HTTP request latency per host'),
+            ('scraper_response_size_bytes', 'response_size_bytes', 'HTTP response body size per host')
+        ]:
+            lines += [f'# HELP {metric} {help_text}', f'# TYPE {metric} histogram']
+            for host, hist in report[key].items():
+                for bound, count in hist['buckets']:
+                    lines.append(f'{metric}_bucket{{host="{host}",le="{bound}"}} {count}')
+                lines.append(f'{metric}_sum{{host="{host}"}} {hist["sum"]}')
+                lines.append(f'{metric}_count{{host="{host}"}} {hist["count"]}')
+
+        return '\n'.join(lines) + '\n'
+
+    def write_reports(self, json_path, prom_path=None):
+        """Write the JSON report and optionally a Prometheus textfile"""
+        directory = os.path.dirname(json_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2)
+        if prom_path:
+            with open(prom_path, 'w', encoding='utf-8') as f:
+                f.write(self.prometheus_text())
+
+
+def profile_call(func, profile_path=None, trace_memory=False, profile=True, top=25):
+    """Run func under cProfile and/or tracemalloc and return (result, summary text)"""
+    # Profiling modules load only when a run is actually profiled
+    import cProfile
+    import pstats
+    import tracemalloc
+
+    profiler = cProfile.Profile() if profile else None
+    summary = io.StringIO()
+    if trace_memory:
+        tracemalloc.start()
+    if profiler:
+        profiler.enable()
+    try:
+        result = func()
+    finally:
+        if profiler:
+            profiler.disable()
+            stats = pstats.Stats(profiler, stream=summary).sort_stats('cumulative')
+            stats.print_stats(top)
+            if profile_path:
+                stats.dump_stats(profile_path)
+        if trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            summary.write(f"\nMemory: current {current / 1024 / 1024:.1f} MiB, peak {peak / 1024 / 1024:.1f} MiB\n")
+            for stat in snapshot.statistics('lineno')[:top]:
+                summary.write(f"{stat}\n")
+    return result, summary.getvalue()
@@ -0,0 +1,181 @@
+"""
+Background publish queue
+Coalesces several scrape runs into one git commit of just their changed data files (deltas and the run manifest) and pushes without blocking the scraper
+"""
+
+import argparse
+import json
+import os
+import queue
+import subprocess
+import threading
+import time
+from datetime import datetime
+
+
+class GitError(Exception):
+    """Raised when a git command fails"""
+
+
+class PublishQueue:
+    def __init__(self, repo_dir='.', remote='origin', branch=None, batch_window=300.0, max_batch=10,
+                 push=True, pending_path='data/publish_pending.json'):
+        self.repo_dir = os.path.abspath(repo_dir)
+        self.remote = remote
+        self.branch = branch
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.push = push
+        self.pending_path = os.path.join(self.repo_dir, pending_path)
+        self.stats = {'runs': 0, 'commits': 0, 'pushes': 0, 'failures': 0}
+
+        self._queue = queue.Queue()
+        self._pending = self._load_pending()
+        self._pending_lock = threading.Lock()
+        # Runs left pending by a previous process go out with the first batch
+        for entry in self._pending:
+            self._queue.put(entry)
+        self._stop = threading.Event()
+        self._thread = None
+
+    def git(self, *args):
+        """Run a git command in the repository (argument list, no shell) and return its stdout"""
+        result = subprocess.run(['git', *args], cwd=self.repo_dir, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise GitError(f"git {' '.join(args[:2])} failed: {result.stderr.strip() or result.stdout.strip()}")
+        return result.stdout
+
+    def enqueue(self, paths, message):
+        """Queue one run's data files for publishing and return immediately"""
+        entry = {
+            'paths': [os.path.relpath(os.path.abspath(path), self.repo_dir) for path in paths if path],
+            'message': message,
+            'queued_at': datetime.now().isoformat()
+        }
+        # Persisted first, so a crash before the commit still publishes the run on the next start
+        with self._pending_lock:
+            self._pending.append(entry)
+            self._save_pending()
+        self._queue.put(entry)
+        self.start()
+
+    def start(self):
+        """Start the background worker"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._worker, name='publish-queue', daemon=True)
+        self._thread.start()
+
+    def close(self, timeout=None):
+        """Publish whatever is queued, then stop the worker"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _worker(self):
+        while True:
+            try:
+                first = self._queue.get(timeout=0.5)
+            except queue.Empty:
+                if self._stop.is_set():
+                    return
+                continue
+
+            # Coalesce: keep collecting runs until the window closes, the batch is full or we are stopping
+            batch = [first]
+            deadline = time.monotonic() + self.batch_window
+            while len(batch) < self.max_batch and not self._stop.is_set():
+                try:
+                    batch.append(self._queue.get(timeout=max(0.0, min(0.5, deadline - time.monotonic()))))
+                except queue.Empty:
+                    if time.monotonic() >= deadline:
+                        break
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self.publish(batch)
+            except GitError as e:
+                self.stats['failures'] += 1
+                if self._stop.is_set():
+                    # Still recorded in the pending file, so the next start retries
+                    print(f"⚠️ Publish failed, leaving {len(batch)} run(s) pending: {e}")
+                    return
+                print(f"⚠️ Publish failed, retrying later: {e}")
+                for entry in batch:
+                    self._queue.put(entry)
+                self._stop.wait(min(300, 5 * 2 ** min(self.stats['failures'], 6)))
+
+    def publish(self, batch):
+        """Commit the batch's changed files as one commit and push"""
+        paths = sorted({path for entry in batch for path in entry['paths']
+                        if os.path.exists(os.path.join(self.repo_dir, path))})
+        if paths:
+            self.git('add', '--', *paths)
+            changed = self.git('diff', '--cached', '--name-only', '--', *paths).split()
+            if changed:
+                subject = (batch[0]['message'] if len(batch) == 1
+                           else f"Publish {len(batch)} scrape runs - {datetime.now():%Y-%m-%d %H:%M:%S}")
+                body = '\n'.join(f"- {entry['message']}" for entry in batch)
+                # Pathspec commit: only these files, whatever else happens to be staged
+                self.git('commit', '-m', subject, '-m', body, '--', *changed)
+                self.stats['commits'] += 1
+                print(f"💾 Published {len(batch)} run(s) in one commit ({len(changed)} files)")
+
+        # Pushed even without a new commit: an earlier commit may have been left unpushed by a failed push
+        if self.push:
+            target = f'HEAD:{self.branch}' if self.branch else 'HEAD'
+            self.git('push', self.remote, target)
+            self.stats['pushes'] += 1
+            print(f"📤 Pushed to {self.remote}")
+
+        self.stats['runs'] += len(batch)
+        with self._pending_lock:
+            done = {id(entry) for entry in batch}
+            self._pending = [entry for entry in self._pending if id(entry) not in done]
+            self._save_pending()
+
+    def _load_pending(self):
+        try:
+            with open(self.pending_path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return []
+
+    def _save_pending(self):
+        directory = os.path.dirname(self.pending_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        tmp = self.pending_path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self._pending, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.pending_path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Publish scrape runs left pending by the background queue')
+    parser.add_argument('--repo', default='.')
+    parser.add_argument('--remote', default='origin')
+    parser.add_argument('--branch')
+    parser.add_argument('--no-push', action='store_true')
+    args = parser.parse_args(argv)
+
+    publisher = PublishQueue(args.repo, args.remote, args.branch, batch_window=0, push=not args.no_push)
+    if not publisher._pending:
+        print("✅ Nothing pending to publish")
+        return 0
+    print(f"🔄 Publishing {len(publisher._pending)} pending run(s)...")
+    publisher.start()
+    publisher.close()
+    return 1 if publisher.stats['failures'] else 0
+
+
+if __name__ == "__main__":
+    exit(main())
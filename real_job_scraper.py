@@ -4,20 +4,103 @@ Targets Work From Home roles and Fintech companies with PPO offers
 """
 
 import requests
-import pandas as pd
 import time
 import re
-from datetime import datetime
-from bs4 import BeautifulSoup
+from datetime import datetime, timedelta
 import json
 import os
+from job_verifier import ConcurrentVerifier, DEADLINE_RESULT, UNVERIFIED_PREFIX
+from verification_cache import VerificationCache
+from page_classifier import classify_response, is_generic_landing, GONE_STATUSES, MAX_BYTES
+from job_sources import build_adapters, iter_source_jobs
+from html_parsing import ParsePool
+from seen_index import SeenPostingsIndex
+from job_storage import resolve_format
+from run_manifest import RunManifest
+from transport import ResilientTransport, RETRY_STATUSES, is_transient_error
+from pipeline_metrics import PipelineMetrics, profile_call
+from job_records import JobBatchBuilder, as_record
 
 class RealJobScraper:
-    def __init__(self):
+    def __init__(self, max_workers=16, per_host_limit=4, verify_deadline=300,
+                 cache_path='data/verification_cache.sqlite', cache_ttl=6 * 3600, cache_max_entries=50000,
+                 max_page_bytes=MAX_BYTES, use_live_sources=True,
+                 seen_index_path='data/seen_postings.sqlite', reverify_after=12 * 3600,
+                 output_format='csv', history_dir='data/history', manifest_path='data/run_manifest.json',
+                 host_rate=5.0, max_retries=3, host_pool_sizes=None,
+                 dedup=True,
+                 scoring_weights=None, min_relevance=None, parse_workers=2, publisher=None,
+                 head_first=True):
         self.session = requests.Session()
         self.jobs_data = []
         self.setup_session()
         
+        # Stage timers, per-host request histograms and counters for the run report
+        self.metrics = PipelineMetrics()
+        self.metrics_dir = 'data/metrics'
+        # Cache and transport stats are lifetime totals; reports count from these values (see reset_run)
+        self.stats_baseline = {}
+        
+        # Pooled, rate-limited, retrying transport over the shared session
+        self.transport = ResilientTransport(
+            self.session,
+            pool_connections=max_workers,
+            pool_maxsize=max(per_host_limit, 10),
+            host_pool_sizes=host_pool_sizes,
+            rate=host_rate,
+            max_retries=max_retries,
+            metrics=self.metrics
+        )
+        
+        # Persistent verdict cache (set cache_path=None to always fetch)
+        self.cache = VerificationCache(cache_path, ttl=cache_ttl, max_entries=cache_max_entries) if cache_path else None
+        
+        # Seen-postings index: unchanged postings verified within reverify_after seconds are not re-fetched
+        self.seen_index = SeenPostingsIndex(seen_index_path, reverify_after=reverify_after) if seen_index_path else None
+        self.run_changes = []
+        # Live sources whose last fetch stopped on an error (their results are incomplete)
+        self.failed_sources = set()
+        
+        # Duplicate detection across sources within a run (dedup=False verifies every candidate)
+        self.dedup = dedup
+        
+        # Relevance scoring: weights override job_scoring.DEFAULT_WEIGHTS; postings below min_relevance are dropped
+        self.scoring_weights = scoring_weights
+        self.min_relevance = min_relevance
+        
+        # Listing pages are parsed in this many worker processes (0 parses inline); one pool serves every run
+        self.parse_pool = ParsePool(parse_workers)
+        
+        # Tiered verification: a HEAD request settles obvious cases before any page body is downloaded
+        self.head_first = head_first
+        
+        # Optional publish_queue.PublishQueue: each saved run's delta and manifest are committed in the background
+        self.publisher = publisher
+        
+        # Snapshot file format: 'csv', 'parquet' or 'feather'
+        self.output_format = resolve_format(output_format)
+        
+        # Run manifest: atomic sequence numbers, per-run records and the latest snapshot
+        self.run_manifest = RunManifest(manifest_path)
+        self.run_started_at = None
+        self.last_sequence = None
+        
+        # Append-only history of every run, indexed by scraped_at (opened on first use)
+        self.history_dir = history_dir
+        self._history = None
+        
+        # Concurrent verification limits (global workers, per-host workers, overall seconds)
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+        self.verify_deadline = verify_deadline
+        self.verification_stats = {}
+        
+        # Stop reading a job page after this many bytes
+        self.max_page_bytes = max_page_bytes
+        
+        # Fetch the search pages in job_sources in addition to the curated postings
+        self.use_live_sources = use_live_sources
+        
         # Job sources for App Development, SDE, SWE, Full Stack, Backend with WFH and Fintech PPO
         self.job_sources = {
             'LinkedIn': {
@@ -27,7 +110,9 @@ class RealJobScraper:
                     'location': 'India',
                     'f_TPR': 'r86400',
                     'start': 0
-                }
+                },
+                'max_pages': 3,
+                'min_interval': 2.0
             },
             'Indeed': {
                 'search_url': 'https://indeed.com/jobs',
@@ -36,7 +121,9 @@ class RealJobScraper:
                     'l': 'India',
                     'fromage': '1',
                     'filter': '0'
-                }
+                },
+                'max_pages': 3,
+                'min_interval': 3.0
             },
             'AngelList': {
                 'search_url': 'https://angel.co/job-api/v2/jobs',
@@ -44,7 +131,9 @@ class RealJobScraper:
                     'filter[types]': 'full-time',
                     'filter[tags]': 'fintech,remote,backend,full-stack',
                     'page': 1
-                }
+                },
+                'max_pages': 3,
+                'min_interval': 1.0
             }
         }
 
@@ -60,62 +149,106 @@ class RealJobScraper:
 
     def verify_job_status(self, url):
         """Verify if job posting is still open and accepting applications"""
+        return self.verify_with_tier(url)[:2]
+
+    def verify_with_tier(self, url):
+        """(is_open, status_msg, tier) for a posting
+
+        Tier 1 is a HEAD request that settles gone postings, redirects to a generic careers page and
+        unchanged ETags; only the rest are downloaded and classified (tier 2). The tier that decided
+        the verdict ('cache', 'head', 'get', 'unverified' or 'error') comes back with it.
+        """
+        cached = self.cache.get(url) if self.cache else None
+        if cached and self.cache.is_fresh(cached):
+            return self.record_tier('cache', (cached['is_open'], cached['status_msg']))
+        
         try:
-            # Get the page content
-            response = self.session.get(url, timeout=15, allow_redirects=True)
+            if self.head_first:
+                verdict = self.triage_head(url, cached)
+                if verdict is not None:
+                    return self.record_tier('head', verdict)
             
-            if response.status_code != 200:
-                return False, f"HTTP {response.status_code}"
+            # Get the page content (conditional GET when we have a stale cached verdict)
+            headers = VerificationCache.conditional_headers(cached)
+            response = self.transport.get(url, timeout=15, allow_redirects=True, headers=headers, stream=True)
             
-            content = response.text.lower()
+            if response.status_code == 304 and cached:
+                response.close()
+                self.cache.touch(url)
+                return self.record_tier('get', (cached['is_open'], cached['status_msg']))
             
-            # Check for closed position indicators
-            closed_indicators = [
-                'no longer accepting applications',
-                'position is closed',
-                'application closed',
-                'expired',
-                'no longer available',
-                'position filled',
-                'hiring complete',
-                'applications are closed',
-                'this job is no longer available',
-                'position has been filled',
-                'closed position'
-            ]
+            # Rate limits and server errors that outlast the retries say nothing about the posting
+            if response.status_code in RETRY_STATUSES:
+                response.close()
+                return self.record_tier('unverified', (True, f"{UNVERIFIED_PREFIX} - HTTP {response.status_code} after retries"))
             
-            for indicator in closed_indicators:
-                if indicator in content:
-                    return False, f"Closed: {indicator}"
+            is_open, status_msg = self.classify_job_page(response)
             
-            # Check for open position indicators
-            open_indicators = [
-                'apply now',
-                'easy apply',
-                'save job',
-                'application form',
-                'submit application',
-                'apply for this job',
-                'click to apply',
-                'job application',
-                'apply today'
-            ]
+            if self.cache:
+                self.cache.put(url, is_open, status_msg,
+                               etag=response.headers.get('ETag'),
+                               last_modified=response.headers.get('Last-Modified'))
             
-            for indicator in open_indicators:
-                if indicator in content:
-                    return True, "Open - Accepting applications"
-            
-            # If no clear indicators found, assume it's open if page loads successfully
-            return True, "Likely open - Page accessible"
+            return self.record_tier('get', (is_open, status_msg))
             
         except Exception as e:
-            return False, f"Error: {str(e)}"
+            if is_transient_error(e):
+                return self.record_tier('unverified', (True, f"{UNVERIFIED_PREFIX} - {str(e)}"))
+            return self.record_tier('error', (False, f"Error: {str(e)}"))
+
+    def triage_head(self, url, cached):
+        """Tier 1: settle a posting from a HEAD request alone, or return None if the page must be read"""
+        headers = VerificationCache.conditional_headers(cached)
+        response = self.transport.head(url, timeout=10, allow_redirects=True, headers=headers)
+        response.close()
+        
+        etag = response.headers.get('ETag')
+        if cached and (response.status_code == 304 or (etag and etag == cached.get('etag'))):
+            self.cache.touch(url)
+            return cached['is_open'], cached['status_msg']
+        
+        if response.status_code in GONE_STATUSES:
+            verdict = (False, f"HTTP {response.status_code}")
+        elif response.history and is_generic_landing(url, response.url):
+            verdict = (False, f"Closed: redirected to {response.url}")
+        else:
+            # Open-looking, ambiguous, or HEAD not supported: leave it to the full-page tier
+            return None
+        
+        if self.cache:
+            self.cache.put(url, *verdict, etag=etag, last_modified=response.headers.get('Last-Modified'))
+        return verdict
+
+    def record_tier(self, tier, verdict):
+        """Count the tier that decided a verdict and attach it to the verdict"""
+        self.metrics.inc(f'verify_tier_{tier}')
+        return (*verdict, tier)
+
+    def classify_job_page(self, response):
+        """Decide if a fetched job page is open from its status and streamed content"""
+        return classify_response(response, max_bytes=self.max_page_bytes)
 
     def validate_url(self, url):
         """Validate if URL is accessible"""
+        cached = self.cache.get(url, kind='validate') if self.cache else None
+        if cached and self.cache.is_fresh(cached):
+            return cached['is_open']
+        
         try:
-            response = self.session.head(url, timeout=10, allow_redirects=True)
-            return response.status_code == 200
+            headers = VerificationCache.conditional_headers(cached)
+            response = self.transport.head(url, timeout=10, allow_redirects=True, headers=headers)
+            
+            if response.status_code == 304 and cached:
+                self.cache.touch(url, kind='validate')
+                return cached['is_open']
+            
+            is_valid = response.status_code == 200
+            if self.cache and response.status_code not in RETRY_STATUSES:
+                self.cache.put(url, is_valid, f"HTTP {response.status_code}",
+                               etag=response.headers.get('ETag'),
+                               last_modified=response.headers.get('Last-Modified'),
+                               kind='validate')
+            return is_valid
         except:
             return False
 
@@ -123,7 +256,11 @@ class RealJobScraper:
         """Create fresh job postings for App Development, SDE, SWE, Full Stack, Backend with WFH and Fintech PPO"""
         print("🔗 Creating fresh job postings for App Development, SDE, SWE, Full Stack, Backend...")
         
-        fresh_jobs = [
+        return self.verify_jobs(self.get_seed_job_postings())
+
+    def get_seed_job_postings(self):
+        """Curated job postings that are always checked alongside the live sources"""
+        return [
             {
                 'company_name': 'Microsoft',
                 'offered_position': 'Software Engineer - New Grad',
@@ -205,122 +342,300 @@ class RealJobScraper:
                 'scraped_at': datetime.now().isoformat()
             }
         ]
+
+    def iter_candidate_jobs(self, sources=None):
+        """Stream candidate postings: curated seeds first, then each live source as its pages arrive
+
+        sources limits the run to the named job_sources ('Curated' selects the seed postings).
+        """
+        if sources is None or 'Curated' in sources:
+            yield from self.get_seed_job_postings()
         
-        verified_jobs = []
-        for job in fresh_jobs:
-            print(f"🔍 Checking {job['company_name']} - {job['offered_position']}")
+        job_sources = {name: config for name, config in self.job_sources.items() if sources is None or name in sources}
+        if self.use_live_sources and job_sources:
+            pages_before = self.parse_pool.pages
+            adapters = build_adapters(job_sources)
+            yield from iter_source_jobs(self.transport, adapters, self.parse_pool)
+            self.metrics.inc('pages_parsed', self.parse_pool.pages - pages_before)
+            self.failed_sources.update(adapter.name for adapter in adapters if adapter.failed)
+
+    def iter_unique_jobs(self, jobs, dedup_index):
+        """Drop exact and near-duplicate postings before they cost a verification request"""
+        for job in jobs:
+            started = time.perf_counter()
+            duplicate_of = dedup_index.check(job) if dedup_index else None
+            self.metrics.add_stage_time('dedup', time.perf_counter() - started)
+            if duplicate_of:
+                print(f"♊ DUPLICATE: {job['company_name']} - {job['offered_position']} ({job.get('source', 'Curated')})")
+                continue
+            yield job
+
+    def verify_jobs(self, jobs):
+        """Verify job postings concurrently and keep only open ones (input order preserved)"""
+        jobs = list(jobs)
+        order = {id(job): i for i, job in enumerate(jobs)}
+        return sorted(self.iter_verified_jobs(jobs), key=lambda job: order[id(job)])
+
+    def iter_verified_jobs(self, jobs):
+        """Verify a stream of job postings concurrently and yield open ones as their checks complete"""
+        print(f"🔍 Checking job postings ({self.max_workers} workers, {self.per_host_limit} per host)")
+        
+        verifier = ConcurrentVerifier(
+            self.verify_with_tier,
+            max_workers=self.max_workers,
+            per_host_limit=self.per_host_limit,
+            deadline=self.verify_deadline
+        )
+        
+        reused = set()
+        
+        def reuse_verdict(job):
+            verdict = self.seen_index.reusable_verdict(job) if self.seen_index else None
+            if verdict is not None:
+                reused.add(id(job))
+            return verdict
+        
+        tier_counts = {}
+        for job, result in verifier.iter_verify(jobs, url_of=lambda job: job['direct_apply_link'],
+                                                precheck=reuse_verdict):
+            is_open, status_msg = result[:2]
+            was_reused = id(job) in reused
+            reused.discard(id(job))
+            if was_reused:
+                tier = 'seen_index'
+            elif result == DEADLINE_RESULT:
+                tier = 'deadline'
+            else:
+                # Verdicts from verify_with_tier carry their tier; anything else came from a failed call
+                tier = result[2] if len(result) > 2 else 'error'
+            job['verified_by'] = tier
+            tier_counts[tier] = tier_counts.get(tier, 0) + 1
+            # Postings that could not be checked keep their previous state in the index
+            verdict_known = (is_open, status_msg) != DEADLINE_RESULT and not status_msg.startswith(UNVERIFIED_PREFIX)
+            if self.seen_index and verdict_known:
+                change = self.seen_index.record(job, is_open, status_msg, verified=not was_reused)
+                if change:
+                    self.run_changes.append(dict(job, change=change, status_msg=status_msg))
             
-            # Verify job status
-            is_open, status_msg = self.verify_job_status(job['direct_apply_link'])
+            if was_reused:
+                status_msg = f"{status_msg}, unchanged since last check"
             
             if is_open:
-                verified_jobs.append(job)
                 print(f"✅ OPEN: {job['company_name']} - {job['offered_position']} ({status_msg})")
+                yield job
             else:
                 print(f"❌ CLOSED: {job['company_name']} - {job['offered_position']} ({status_msg})")
         
-        return verified_jobs
+        stats = verifier.last_stats
+        print(f"⚡ Verified {stats['verified']} URLs across {stats['hosts']} hosts in {stats['elapsed_seconds']}s ({stats['urls_per_second']} URLs/sec)")
+        if stats['skipped']:
+            print(f"♻️ {stats['skipped']} unchanged postings reused their recent verdict")
+        if stats['timed_out']:
+            print(f"⏱️ {stats['timed_out']} URLs not verified before the {self.verify_deadline}s deadline")
+        if tier_counts:
+            print(f"🪜 Verdicts by tier: {', '.join(f'{tier} {count}' for tier, count in sorted(tier_counts.items()))}")
+        self.verification_stats = dict(stats, tiers=tier_counts)
 
-    def create_real_job_links(self):
+    def create_real_job_links(self, sources=None):
         """Create fresh job postings with direct apply links for App Development, SDE, SWE, Full Stack, Backend with WFH and Fintech PPO"""
         print("🔗 Creating fresh job postings for App Development, SDE, SWE, Full Stack, Backend with WFH and Fintech PPO...")
         
-        # Use fresh job postings
-        fresh_jobs = self.create_fresh_job_postings()
+        self.run_changes = []
+        self.failed_sources = set()
+        self.run_started_at = time.monotonic()
+        
+        # Stream candidates through dedup and verification as they arrive; fetch and dedup time are charged separately
+        stages_before = self.metrics.stages.get('fetch', 0.0) + self.metrics.stages.get('dedup', 0.0)
+        started = time.perf_counter()
+        candidates = self.metrics.timed_iter(self.iter_candidate_jobs(sources), 'fetch')
+        
+        # Duplicates are dropped before verification so they never cost a request
+        dedup_index = None
+        if self.dedup:
+            from dedup import DedupIndex
+            dedup_index = DedupIndex()
+        # Open postings are kept as compact records rather than dicts
+        verified_jobs = [as_record(job) for job in self.iter_verified_jobs(self.iter_unique_jobs(candidates, dedup_index))]
+        
+        stages_inside = self.metrics.stages.get('fetch', 0.0) + self.metrics.stages.get('dedup', 0.0) - stages_before
+        self.metrics.add_stage_time('verify', time.perf_counter() - started - stages_inside)
+        duplicates = dedup_index.stats['exact_duplicates'] + dedup_index.stats['near_duplicates'] if dedup_index else 0
+        self.metrics.counters['duplicates_dropped'] = duplicates
+        if duplicates:
+            print(f"♊ Dropped {duplicates} duplicate postings before verification")
         
-        # Filter for latest jobs (last 7 days)
         print("📅 Filtering for latest jobs (last 7 days)...")
-        latest_jobs = self.filter_latest_jobs(fresh_jobs, days_old=7)
+        with self.metrics.stage('filter'):
+            latest_jobs = self.filter_latest_jobs(verified_jobs, days_old=7)
         
         self.jobs_data = latest_jobs
-        print(f"📊 Total fresh job postings found: {len(fresh_jobs)}")
+        print(f"📊 Total fresh job postings found: {self.verification_stats.get('urls', 0)}")
         print(f"🆕 Latest jobs (last 7 days): {len(latest_jobs)}")
         print(f"🔗 All links are direct application URLs for App Development, SDE, SWE, Full Stack, Backend")
         print(f"🏠 Work From Home options available")
         print(f"💰 Fintech companies with PPO offers up to 20 LPA")
 
+    @property
+    def history(self):
+        if self._history is None:
+            from history_store import JobHistoryStore
+            self._history = JobHistoryStore(self.history_dir, fmt=self.output_format)
+            imported = self._history.import_snapshots()
+            if imported:
+                print(f"📚 Imported {imported} earlier snapshots into {self.history_dir}")
+        return self._history
+
     def filter_latest_jobs(self, jobs, days_old=7):
-        """Filter jobs to show only latest postings within specified days"""
-        from datetime import datetime, timedelta
+        """Filter jobs (records or dicts) to the latest postings within specified days, as records newest first"""
+        records = [as_record(job) for job in jobs]
+        if not records:
+            return []
         
-        cutoff_date = datetime.now() - timedelta(days=days_old)
-        latest_jobs = []
+        import pandas as pd
+        from history_store import time_window
         
-        for job in jobs:
-            try:
-                job_date = datetime.fromisoformat(job['scraped_at'].replace('T', ' ').split('.')[0])
-                if job_date >= cutoff_date:
-                    job['days_old'] = (datetime.now() - job_date).days
-                    latest_jobs.append(job)
-            except:
-                # If date parsing fails, include the job
-                job['days_old'] = 0
-                latest_jobs.append(job)
-        
-        # Sort by posting date (newest first)
-        latest_jobs.sort(key=lambda x: x['scraped_at'], reverse=True)
-        
-        return latest_jobs
+        # Timestamps are already parsed on the records; missing ones become NaT and are kept, leading
+        dates = pd.DatetimeIndex(pd.to_datetime(pd.Series([record.scraped_at for record in records], dtype='object'),
+                                                errors='coerce'))
+        frame = pd.DataFrame({'position': range(len(records))}, index=dates)
+        undated = frame[dates.isna()]
+        # Same range query as the history store; reversed first so equal timestamps keep input order once flipped
+        dated = frame[dates.notna()].iloc[::-1].sort_index(kind='stable')
+        window = time_window(dated, since=datetime.now() - timedelta(days=days_old))
+        
+        return [records[i] for i in [*undated['position'], *window['position']]]
 
     def save_real_jobs(self):
         """Save real job data with direct links"""
+        from job_scoring import enrich_jobs, rank_jobs
+        from job_storage import write_jobs
+        
         if not self.jobs_data:
             self.create_real_job_links()
         
         # Create DataFrame
-        df = pd.DataFrame(self.jobs_data)
-        
-        # Ensure required columns
-        required_columns = ['company_name', 'offered_position', 'direct_apply_link', 'job_description', 'hr_email', 'scraped_at']
-        
-        for col in required_columns:
-            if col not in df.columns:
-                df[col] = ''
+        with self.metrics.stage('dataframe'):
+            # Columns are built straight from the records, no dict per row
+            required_columns = ['company_name', 'offered_position', 'direct_apply_link', 'job_description', 'hr_email', 'scraped_at',
+                                'source', 'verified_by']
+            df = JobBatchBuilder.from_records(self.jobs_data).to_frame(required_columns)
+            
+            df = df.sort_values('company_name')
         
-        df = df[required_columns]
-        df = df.sort_values('company_name')
+        # Extract PPO/stipend, remote/fintech flags and role, then score
+        with self.metrics.stage('scoring'):
+            df = enrich_jobs(df, self.scoring_weights)
+            before = len(df)
+            # Saved most relevant first (equal scores stay in company order)
+            df = rank_jobs(df, min_score=self.min_relevance)
+            if self.min_relevance is not None:
+                print(f"🎯 Relevance filter kept {len(df)}/{before} jobs (score >= {self.min_relevance})")
         
         # Generate filename with sequence and timestamp
         sequence = self.get_next_sequence_number()
+        self.last_sequence = sequence
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        csv_filename = f'data/real_fintech_jobs_{sequence:03d}_{timestamp}.csv'
+        with self.metrics.stage('write'):
+            # Open the history first: it imports earlier snapshots, which must not include this run's
+            history = self.history
+            jobs_filename = write_jobs(df, f'data/real_fintech_jobs_{sequence:03d}_{timestamp}', self.output_format)
+        print(f"✅ Saved {len(df)} real job postings to {jobs_filename}")
         
-        # Save to CSV
-        df.to_csv(csv_filename, index=False, encoding='utf-8')
-        print(f"✅ Saved {len(df)} real job postings to {csv_filename}")
+        # Record the run; the manifest also points at this snapshot as the latest one
+        source_counts = {}
+        for job in self.jobs_data:
+            source = job.get('source', 'Curated')
+            source_counts[source] = source_counts.get(source, 0) + 1
+        duration = time.monotonic() - self.run_started_at if self.run_started_at else None
+        self.run_manifest.record_run(sequence, jobs_filename, self.output_format, len(df),
+                                     duration_seconds=duration,
+                                     source_stats={'jobs_per_source': source_counts,
+                                                   'verification': self.verification_stats})
+        print(f"✅ Run {sequence} recorded in {self.run_manifest.path}")
         
-        # Also save as latest
-        latest_filename = 'data/latest_real_fintech_jobs.csv'
-        df.to_csv(latest_filename, index=False, encoding='utf-8')
-        print(f"✅ Also saved as {latest_filename}")
+        with self.metrics.stage('write'):
+            # Append this run to the history store
+            history.append(df, f'{sequence:06d}')
+            
+            # Save what changed since the previous run next to the snapshot
+            delta_filename = f'data/real_fintech_delta_{sequence:03d}_{timestamp}.csv'
+            self.save_delta(delta_filename)
+        
+        # Hand the compact files to the background publisher; git never blocks the scrape
+        if self.publisher:
+            self.publisher.enqueue([delta_filename, self.run_manifest.path, self.run_manifest.log_path],
+                                   f"Scrape run {sequence:03d}: {len(df)} jobs, {len(self.run_changes)} changes")
         
-        return df, csv_filename
+        return df, jobs_filename
+
+    def save_delta(self, filename):
+        """Save postings added, closed or changed in this run"""
+        import pandas as pd
+        
+        columns = ['change', 'company_name', 'offered_position', 'direct_apply_link', 'job_description',
+                   'hr_email', 'scraped_at', 'status_msg']
+        delta_df = pd.DataFrame(self.run_changes, columns=columns)
+        delta_df.to_csv(filename, index=False, encoding='utf-8')
+        
+        counts = delta_df['change'].value_counts()
+        print(f"✅ Saved delta to {filename} "
+              f"(added {counts.get('added', 0)}, closed {counts.get('closed', 0)}, changed {counts.get('changed', 0)})")
 
     def get_next_sequence_number(self):
         """Get next sequence number"""
-        if not os.path.exists('data'):
-            os.makedirs('data')
-        
-        import glob
-        pattern = os.path.join('data', 'real_fintech_jobs_*.csv')
-        existing_files = glob.glob(pattern)
-        
-        if not existing_files:
-            return 1
-        
-        numbers = []
-        for file in existing_files:
-            try:
-                basename = os.path.basename(file)
-                number_part = basename.replace('real_fintech_jobs_', '').replace('.csv', '')
-                numbers.append(int(number_part.split('_')[0]))
-            except:
-                continue
+        return self.run_manifest.allocate_sequence()
+
+    def write_metrics_report(self, run_name=None):
+        """Write the run report as JSON and as a Prometheus textfile"""
+        # Fold component statistics into the counters, counted since the run started
+        for name, value in self.component_stats().items():
+            self.metrics.counters[name] = value - self.stats_baseline.get(name, 0)
+        self.metrics.counters['seen_index_reused'] = self.verification_stats.get('skipped', 0)
+        self.metrics.counters['verification_timed_out'] = self.verification_stats.get('timed_out', 0)
         
-        return max(numbers) + 1 if numbers else 1
+        if run_name is None:
+            run_name = f'run_{self.last_sequence:03d}' if self.last_sequence else 'run'
+        json_path = os.path.join(self.metrics_dir, f'{run_name}.json')
+        prom_path = os.path.join(self.metrics_dir, 'scraper.prom')
+        self.metrics.write_reports(json_path, prom_path)
+        print(f"📈 Metrics saved to {json_path} and {prom_path}")
+        return json_path
+
+    def component_stats(self):
+        """Lifetime cache and transport counters, prefixed as they appear in the run report"""
+        stats = {f'cache_{name}': value for name, value in (self.cache.stats.items() if self.cache else ())}
+        stats.update((f'http_{name}', value) for name, value in self.transport.stats.items())
+        return stats
 
-    def run_real_scraper(self):
-        """Main fresh scraper function for App Development, SDE, SWE, Full Stack, Backend with WFH and Fintech PPO"""
+    def reset_run(self):
+        """Start a new run on a long-lived scraper: fresh metrics and job list, same sessions and caches"""
+        self.metrics = PipelineMetrics()
+        self.transport.metrics = self.metrics
+        self.stats_baseline = self.component_stats()
+        self.jobs_data = []
+        self.run_changes = []
+        self.verification_stats = {}
+    
+    def close(self):
+        """Release the session, parse workers, caches and index"""
+        self.session.close()
+        self.parse_pool.close()
+        if self.cache:
+            self.cache.close()
+        if self.seen_index:
+            self.seen_index.close()
+    
+    def run_real_scraper(self, profile_path=None, trace_memory=False):
+        """Main fresh scraper function for App Development, SDE, SWE, Full Stack, Backend with WFH and Fintech PPO
+
+        Pass profile_path to save cProfile stats for this run, and trace_memory=True to report allocations.
+        """
+        if profile_path or trace_memory:
+            df, summary = profile_call(self.run_real_scraper, profile_path=profile_path,
+                                       trace_memory=trace_memory, profile=bool(profile_path))
+            print(f"\n🔬 Profile summary:\n{summary}")
+            return df
+        
         print("🚀 Starting Fresh Job Scraper...")
         print("💼 Targeting App Development, SDE, SWE, Full Stack, Backend Development")
         print("🏠 Work From Home opportunities included")
@@ -331,10 +646,14 @@ class RealJobScraper:
         print("🔗 Providing only direct job posting links for verified open positions")
         
         self.create_real_job_links()
-        df, csv_filename = self.save_real_jobs()
+        with self.metrics.stage('save'):
+            df, jobs_filename = self.save_real_jobs()
+        self.write_metrics_report()
         
         print(f"\n✅ Fresh job scraping completed!")
         print(f"📊 Found {len(df)} verified open job postings (last 7 days)")
+        recent = self.history.query(days_old=7, columns=['direct_apply_link'])
+        print(f"📚 History: {recent['direct_apply_link'].nunique()} distinct postings seen in the last 7 days")
         print(f"💼 Positions: App Development, SDE, SWE, Full Stack, Backend")
         print(f"🏠 Work From Home options available")
         print(f"💰 Fintech companies with PPO offers up to 20 LPA")
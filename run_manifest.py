@@ -0,0 +1,143 @@
+"""
+Run manifest
+Allocates snapshot sequence numbers atomically under a lock file and records each run, including which snapshot is latest
+"""
+
+import glob
+import json
+import os
+import time
+from datetime import datetime
+
+
+class ManifestLockTimeout(Exception):
+    """Raised when the manifest lock cannot be acquired in time"""
+
+
+class _FileLock:
+    """Cross-platform exclusive lock based on atomically creating a lock file"""
+
+    def __init__(self, path, timeout=30.0, stale_after=300.0):
+        self.path = path
+        self.timeout = timeout
+        self.stale_after = stale_after
+
+    def __enter__(self):
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(fd, str(os.getpid()).encode())
+                os.close(fd)
+                return self
+            except FileExistsError:
+                self._break_if_stale()
+                if time.monotonic() >= deadline:
+                    raise ManifestLockTimeout(f"Could not lock {self.path} within {self.timeout}s")
+                time.sleep(0.05)
+
+    def __exit__(self, *exc):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def _break_if_stale(self):
+        """Remove a lock left behind by a crashed process"""
+        try:
+            if time.time() - os.path.getmtime(self.path) > self.stale_after:
+                os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class RunManifest:
+    def __init__(self, path='data/run_manifest.json', lock_timeout=30.0):
+        self.path = path
+        self.log_path = os.path.splitext(path)[0] + '_log.jsonl'
+        self.lock = _FileLock(path + '.lock', timeout=lock_timeout)
+
+    def _ensure_directory(self):
+        """Create the manifest's folder before the first write (readers never create it)"""
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+    def allocate_sequence(self):
+        """Reserve the next snapshot sequence number (safe across concurrent scrapers)"""
+        self._ensure_directory()
+        with self.lock:
+            state = self._read()
+            if 'next_sequence' not in state:
+                state['next_sequence'] = self._bootstrap_sequence()
+            sequence = state['next_sequence']
+            state['next_sequence'] = sequence + 1
+            self._write(state)
+        return sequence
+
+    def record_run(self, sequence, path, fmt, rows, duration_seconds=None, source_stats=None):
+        """Record a finished run and make its snapshot the latest"""
+        entry = {
+            'sequence': sequence,
+            'path': path.replace(os.sep, '/'),
+            'format': fmt,
+            'rows': int(rows),
+            'duration_seconds': round(duration_seconds, 3) if duration_seconds is not None else None,
+            'source_stats': source_stats or {},
+            'finished_at': datetime.now().isoformat()
+        }
+        self._ensure_directory()
+        with self.lock:
+            state = self._read()
+            latest = state.get('latest')
+            # A slower concurrent run must not replace a newer snapshot as latest
+            if latest is None or latest.get('sequence', 0) <= sequence:
+                state['latest'] = entry
+            state.setdefault('next_sequence', sequence + 1)
+            self._write(state)
+            with open(self.log_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + '\n')
+        return entry
+
+    def latest(self):
+        """Entry for the latest recorded run (or None)"""
+        return self._read().get('latest')
+
+    def latest_path(self):
+        """Path of the latest snapshot if it still exists"""
+        entry = self.latest()
+        path = entry.get('path') if entry else None
+        return path if path and os.path.exists(path) else None
+
+    def runs(self):
+        """All recorded runs, oldest first"""
+        try:
+            with open(self.log_path, encoding='utf-8') as f:
+                return [json.loads(line) for line in f if line.strip()]
+        except OSError:
+            return []
+
+    def _read(self):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, state):
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp, self.path)
+
+    def _bootstrap_sequence(self):
+        """One-time scan of existing snapshot files when no manifest exists yet"""
+        directory = os.path.dirname(self.path) or '.'
+        numbers = []
+        for file in glob.glob(os.path.join(directory, 'real_fintech_jobs_*.*')):
+            try:
+                basename = os.path.splitext(os.path.basename(file))[0]
+                numbers.append(int(basename.replace('real_fintech_jobs_', '').split('_')[0]))
+            except ValueError:
+                continue
+        return max(numbers) + 1 if numbers else 1
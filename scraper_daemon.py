@@ -0,0 +1,249 @@
+"""
+Scraper daemon
+Keeps one RealJobScraper (and its warm connection pools) alive, scrapes each source on its own interval and re-verifies the stalest known postings on a separate cadence
+"""
+
+import argparse
+import heapq
+import json
+import os
+import signal
+import threading
+import time
+from datetime import datetime
+
+from job_records import as_record
+from job_storage import read_jobs
+from job_verifier import ConcurrentVerifier, DEADLINE_RESULT, UNVERIFIED_PREFIX
+from publish_queue import PublishQueue
+from real_job_scraper import RealJobScraper
+
+DEFAULT_INTERVALS = {
+    'Curated': 6 * 3600,
+    'LinkedIn': 3600,
+    'Indeed': 2 * 3600,
+    'AngelList': 3 * 3600
+}
+
+REVERIFY_TASK = '__reverify__'
+
+
+class ScraperDaemon:
+    def __init__(self, scraper=None, source_intervals=None, reverify_interval=15 * 60, reverify_batch=50,
+                 checkpoint_path='data/daemon_checkpoint.json'):
+        self.scraper = scraper or RealJobScraper()
+        self.source_intervals = dict(DEFAULT_INTERVALS if source_intervals is None else source_intervals)
+        self.reverify_interval = reverify_interval
+        self.reverify_batch = reverify_batch
+        self.checkpoint_path = checkpoint_path
+        self.stats = {'source_runs': 0, 'reverified': 0, 'reverify_closed': 0}
+
+        # (due timestamp, task name) min-heap; a task is a source name or REVERIFY_TASK
+        self.schedule = []
+        # (last_verified, fingerprint, posting) min-heap: the stalest verdict is re-checked first
+        self.reverify_queue = []
+        # Source name -> open postings from its latest run; every snapshot merges all sources
+        self.source_jobs = {}
+        self._stop = threading.Event()
+
+    def intervals(self):
+        """Task name -> seconds between runs"""
+        intervals = dict(self.source_intervals)
+        if self.scraper.seen_index:
+            intervals[REVERIFY_TASK] = self.reverify_interval
+        return intervals
+
+    def load_latest_snapshot(self):
+        """Seed each source's postings from the latest snapshot so the first runs after a start stay complete"""
+        path = self.scraper.run_manifest.latest_path()
+        if not path:
+            return
+        try:
+            df = read_jobs(path)
+        except Exception as e:
+            print(f"⚠️ Could not read latest snapshot {path}: {e}")
+            return
+        # Snapshots written before the source column existed cannot be split by source
+        if 'source' not in df.columns:
+            return
+        for job in df.dropna(subset=['source']).to_dict('records'):
+            self.source_jobs.setdefault(job['source'], []).append(as_record(job))
+        print(f"📂 Loaded {len(df)} postings from {path}")
+
+    def merged_jobs(self):
+        """Latest postings of every source, newest first"""
+        return self.scraper.filter_latest_jobs(job for jobs in self.source_jobs.values() for job in jobs)
+
+    def load_checkpoint(self):
+        """Schedule every task, resuming saved due times so a restart does not rerun everything at once"""
+        try:
+            with open(self.checkpoint_path, encoding='utf-8') as f:
+                saved = json.load(f).get('next_due', {})
+        except (OSError, ValueError):
+            saved = {}
+
+        now = time.time()
+        self.schedule = [(float(saved.get(task, now)), task) for task in self.intervals()]
+        heapq.heapify(self.schedule)
+        if saved:
+            print(f"♻️ Resumed schedule from {self.checkpoint_path}")
+
+    def save_checkpoint(self):
+        """Atomically persist the next due time of every task"""
+        directory = os.path.dirname(self.checkpoint_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        state = {
+            'saved_at': datetime.now().isoformat(),
+            'next_due': {task: due for due, task in self.schedule},
+            'stats': self.stats
+        }
+        tmp = self.checkpoint_path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp, self.checkpoint_path)
+
+    def run_source(self, name):
+        """One scrape of a single source through the full pipeline"""
+        print(f"\n🕒 [{datetime.now():%H:%M:%S}] Scraping {name}")
+        self.scraper.reset_run()
+        self.scraper.create_real_job_links(sources=[name])
+        fresh = self.scraper.jobs_data
+        if name in self.scraper.failed_sources and self.source_jobs.get(name):
+            # The fetch stopped on an error, so postings it never reached are kept until a clean run
+            links = {job['direct_apply_link'] for job in fresh}
+            kept = [job for job in self.source_jobs[name] if job['direct_apply_link'] not in links]
+            print(f"⚠️ {name} fetch was incomplete, keeping {len(kept)} postings from its previous run")
+            fresh = fresh + kept
+        self.source_jobs[name] = fresh
+        # Save the run as a full snapshot so a single source never replaces the others as latest
+        self.scraper.jobs_data = self.merged_jobs()
+        if self.scraper.jobs_data:
+            self.scraper.save_real_jobs()
+        self.scraper.write_metrics_report()
+        self.stats['source_runs'] += 1
+
+    def refill_reverify_queue(self):
+        for posting in self.scraper.seen_index.stalest(limit=self.reverify_batch * 4):
+            heapq.heappush(self.reverify_queue, (posting['last_verified'], posting['fingerprint'], posting))
+
+    def reverify(self):
+        """Re-check the stalest open postings and record their verdicts"""
+        if not self.reverify_queue:
+            self.refill_reverify_queue()
+        batch = [heapq.heappop(self.reverify_queue)[2]
+                 for _ in range(min(self.reverify_batch, len(self.reverify_queue)))]
+        if not batch:
+            return
+
+        print(f"\n🔁 [{datetime.now():%H:%M:%S}] Re-verifying {len(batch)} stalest postings")
+        self.scraper.reset_run()
+        verifier = ConcurrentVerifier(
+            self.scraper.verify_job_status,
+            max_workers=self.scraper.max_workers,
+            per_host_limit=self.scraper.per_host_limit,
+            deadline=self.scraper.verify_deadline
+        )
+        closed_links = set()
+        for posting, (is_open, status_msg) in verifier.iter_verify(batch, url_of=lambda p: p['direct_apply_link']):
+            if (is_open, status_msg) == DEADLINE_RESULT or status_msg.startswith(UNVERIFIED_PREFIX):
+                continue
+            self.stats['reverified'] += 1
+            self.scraper.metrics.inc('reverified')
+            if self.scraper.seen_index.record_verdict(posting['fingerprint'], is_open, status_msg) == 'closed':
+                self.stats['reverify_closed'] += 1
+                self.scraper.metrics.inc('reverify_closed')
+                self.scraper.run_changes.append(dict(posting, change='closed', status_msg=status_msg))
+                closed_links.add(posting['direct_apply_link'])
+                print(f"❌ CLOSED: {posting['company_name']} - {posting['offered_position']} ({status_msg})")
+        self.scraper.verification_stats = dict(verifier.last_stats)
+
+        # Closed postings leave the next snapshot; the closures themselves go out as a delta
+        for name, jobs in self.source_jobs.items():
+            self.source_jobs[name] = [job for job in jobs if job['direct_apply_link'] not in closed_links]
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        if self.scraper.run_changes:
+            delta_filename = f'data/real_fintech_reverify_delta_{timestamp}.csv'
+            self.scraper.save_delta(delta_filename)
+            if self.scraper.publisher:
+                self.scraper.publisher.enqueue([delta_filename],
+                                               f"Re-verified {len(batch)} postings: {len(closed_links)} closed")
+        self.scraper.write_metrics_report(run_name=f'reverify_{timestamp}')
+
+    def run_task(self, task):
+        if task == REVERIFY_TASK:
+            self.reverify()
+        else:
+            self.run_source(task)
+
+    def request_stop(self, signum=None, frame=None):
+        """Finish the current task, checkpoint and exit"""
+        if not self._stop.is_set():
+            print("\n🛑 Shutdown requested, finishing current task...")
+        self._stop.set()
+
+    def install_signal_handlers(self):
+        signal.signal(signal.SIGINT, self.request_stop)
+        signal.signal(signal.SIGTERM, self.request_stop)
+
+    def run(self, max_tasks=None):
+        """Run scheduled tasks until stopped (or max_tasks have run)"""
+        self.load_checkpoint()
+        self.load_latest_snapshot()
+        intervals = self.intervals()
+        print(f"🤖 Scraper daemon started: {', '.join(f'{task} every {int(interval)}s' for task, interval in intervals.items() if task != REVERIFY_TASK)}")
+
+        tasks_run = 0
+        try:
+            while not self._stop.is_set() and (max_tasks is None or tasks_run < max_tasks):
+                due, task = self.schedule[0]
+                wait = due - time.time()
+                if wait > 0:
+                    self._stop.wait(wait)
+                    continue
+
+                heapq.heappop(self.schedule)
+                try:
+                    self.run_task(task)
+                except Exception as e:
+                    print(f"❌ Task {task} failed: {e}")
+                # Schedule from now so a slow run never causes back-to-back catch-up runs
+                heapq.heappush(self.schedule, (time.time() + intervals[task], task))
+                self.save_checkpoint()
+                tasks_run += 1
+        finally:
+            self.save_checkpoint()
+            if self.scraper.publisher:
+                self.scraper.publisher.close()
+            self.scraper.close()
+            print(f"👋 Scraper daemon stopped ({self.stats['source_runs']} source runs, {self.stats['reverified']} postings re-verified)")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Run the job scraper as a long-lived scheduler')
+    parser.add_argument('--interval', action='append', default=[], metavar='SOURCE=SECONDS',
+                        help='Override a source interval, e.g. LinkedIn=1800 (repeatable)')
+    parser.add_argument('--reverify-interval', type=float, default=15 * 60)
+    parser.add_argument('--reverify-batch', type=int, default=50)
+    parser.add_argument('--checkpoint', default='data/daemon_checkpoint.json')
+    parser.add_argument('--publish', action='store_true', help='Commit and push each run\'s delta in the background')
+    parser.add_argument('--publish-window', type=float, default=30 * 60, help='Seconds of runs coalesced per commit')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    intervals = dict(DEFAULT_INTERVALS)
+    for item in args.interval:
+        name, _, seconds = item.partition('=')
+        intervals[name] = float(seconds)
+    publisher = PublishQueue(batch_window=args.publish_window) if args.publish else None
+    daemon = ScraperDaemon(RealJobScraper(publisher=publisher), source_intervals=intervals,
+                           reverify_interval=args.reverify_interval, reverify_batch=args.reverify_batch,
+                           checkpoint_path=args.checkpoint)
+    daemon.install_signal_handlers()
+    daemon.run()
+
+
+if __name__ == "__main__":
+    main()
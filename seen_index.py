@@ -0,0 +1,158 @@
+"""
+Seen-postings index
+Remembers every posting across runs by a stable fingerprint so unchanged, recently verified postings can skip verification
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+from verification_cache import normalize_url
+
+
+def _clean(value):
+    return ' '.join(str(value or '').lower().split())
+
+
+def posting_fingerprint(job):
+    """Stable identity of a posting: company, position and canonical apply link"""
+    key = '|'.join([
+        _clean(job.get('company_name')),
+        _clean(job.get('offered_position')),
+        normalize_url(job.get('direct_apply_link') or '')
+    ])
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+
+def content_hash(job):
+    """Hash of the mutable posting content, used to detect changed postings"""
+    key = '|'.join([_clean(job.get('job_description')), _clean(job.get('hr_email'))])
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+
+class SeenPostingsIndex:
+    def __init__(self, path='data/seen_postings.sqlite', reverify_after=12 * 3600):
+        self.path = path
+        self.reverify_after = reverify_after
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS seen_postings (
+                fingerprint TEXT PRIMARY KEY,
+                company_name TEXT,
+                offered_position TEXT,
+                direct_apply_link TEXT,
+                content_hash TEXT,
+                is_open INTEGER,
+                status_msg TEXT,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL,
+                last_verified REAL
+            )
+        """)
+        self._conn.commit()
+
+    def lookup(self, job):
+        """Get the stored record for a posting (or None)"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT content_hash, is_open, status_msg, first_seen, last_seen, last_verified '
+                'FROM seen_postings WHERE fingerprint = ?',
+                (posting_fingerprint(job),)
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            'content_hash': row[0],
+            'is_open': bool(row[1]),
+            'status_msg': row[2],
+            'first_seen': row[3],
+            'last_seen': row[4],
+            'last_verified': row[5],
+        }
+
+    def reusable_verdict(self, job):
+        """Stored (is_open, status_msg) if the posting is unchanged and was verified recently, else None"""
+        record = self.lookup(job)
+        if (record is None or record['last_verified'] is None
+                or record['content_hash'] != content_hash(job)
+                or time.time() - record['last_verified'] >= self.reverify_after):
+            return None
+        return record['is_open'], record['status_msg']
+
+    def record(self, job, is_open, status_msg, verified=True):
+        """Store the outcome for a posting and return its change kind ('added', 'changed', 'closed' or None)"""
+        now = time.time()
+        fingerprint = posting_fingerprint(job)
+        new_hash = content_hash(job)
+        previous = self.lookup(job)
+
+        with self._lock:
+            if previous is None:
+                self._conn.execute(
+                    'INSERT INTO seen_postings (fingerprint, company_name, offered_position, direct_apply_link, '
+                    'content_hash, is_open, status_msg, first_seen, last_seen, last_verified) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    (fingerprint, job.get('company_name'), job.get('offered_position'), job.get('direct_apply_link'),
+                     new_hash, int(bool(is_open)), status_msg, now, now, now if verified else None)
+                )
+            else:
+                self._conn.execute(
+                    'UPDATE seen_postings SET content_hash = ?, is_open = ?, status_msg = ?, last_seen = ?, '
+                    'last_verified = CASE WHEN ? THEN ? ELSE last_verified END WHERE fingerprint = ?',
+                    (new_hash, int(bool(is_open)), status_msg, now, int(bool(verified)), now, fingerprint)
+                )
+            self._conn.commit()
+
+        if previous is None or not previous['is_open']:
+            return 'added' if is_open else None
+        if not is_open:
+            return 'closed'
+        if previous['content_hash'] != new_hash:
+            return 'changed'
+        return None
+
+    def stalest(self, limit=100, older_than=None):
+        """Open postings whose verdict is oldest (never-verified first), for scheduled re-verification"""
+        cutoff = time.time() - (self.reverify_after if older_than is None else older_than)
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT fingerprint, company_name, offered_position, direct_apply_link, last_verified '
+                'FROM seen_postings WHERE is_open = 1 AND COALESCE(last_verified, 0) < ? '
+                'ORDER BY COALESCE(last_verified, 0) LIMIT ?',
+                (cutoff, limit)
+            ).fetchall()
+        return [{
+            'fingerprint': row[0],
+            'company_name': row[1],
+            'offered_position': row[2],
+            'direct_apply_link': row[3],
+            'last_verified': row[4] or 0.0
+        } for row in rows]
+
+    def record_verdict(self, fingerprint, is_open, status_msg):
+        """Store a re-verification result without touching the posting content; returns 'closed' or None"""
+        with self._lock:
+            row = self._conn.execute('SELECT is_open FROM seen_postings WHERE fingerprint = ?',
+                                     (fingerprint,)).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                'UPDATE seen_postings SET is_open = ?, status_msg = ?, last_verified = ? WHERE fingerprint = ?',
+                (int(bool(is_open)), status_msg, time.time(), fingerprint)
+            )
+            self._conn.commit()
+        return 'closed' if row[0] and not is_open else None
+
+    def close(self):
+        """Close the underlying database"""
+        with self._lock:
+            self._conn.close()
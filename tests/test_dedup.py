@@ -0,0 +1,62 @@
+from dedup import DedupIndex, title_similarity
+
+
+def job(title, link, description='Build payment APIs in Go. Remote work available. PPO up to 18 LPA.', company='Razorpay'):
+    return {'company_name': company, 'offered_position': title, 'direct_apply_link': link, 'job_description': description}
+
+
+def test_near_identical_titles_survive():
+    index = DedupIndex()
+    assert index.check(job('Backend Engineer', 'https://razorpay.com/jobs/1')) is None
+    assert index.check(job('Backend Engineer II', 'https://razorpay.com/jobs/2')) is None
+    assert index.check(job('Senior Backend Engineer', 'https://razorpay.com/jobs/3')) is None
+    assert index.stats['near_duplicates'] == 0
+
+
+def test_same_link_is_duplicate():
+    index = DedupIndex()
+    first = index.check(job('Backend Engineer', 'https://razorpay.com/jobs/1?utm_source=linkedin'))
+    assert first is None
+    assert index.check(job('Backend Engineer (Payments)', 'https://razorpay.com/jobs/1', company='Razorpay Pvt Ltd'))
+    assert index.stats['exact_duplicates'] == 1
+
+
+def test_same_content_under_new_link_is_duplicate():
+    index = DedupIndex()
+    index.check(job('Backend Engineer', 'https://razorpay.com/jobs/1'))
+    assert index.check(job('backend engineer', 'https://www.linkedin.com/jobs/view/99'))
+    assert index.stats['exact_duplicates'] == 1
+
+
+def test_lightly_edited_description_is_near_duplicate():
+    description = ('Build payment APIs in Go for merchants across India. You will own settlement, refunds and '
+                   'reconciliation services, work with product and risk teams, and keep p99 latency low at peak UPI '
+                   'traffic. Remote work available. Strong fundamentals in SQL and distributed systems. PPO up to 18 LPA.')
+    index = DedupIndex()
+    index.check(job('Backend Engineer', 'https://razorpay.com/jobs/1', description))
+    edited = description.replace('Remote work available', 'Remote work is available')
+    assert index.check(job('Backend Engineer', 'https://www.linkedin.com/jobs/view/99', edited))
+    assert index.stats['near_duplicates'] == 1
+    # The same edit under a different role title is a separate posting
+    assert index.check(job('Backend Engineer II', 'https://razorpay.com/jobs/2', edited)) is None
+
+
+def test_different_companies_never_merge():
+    index = DedupIndex()
+    index.check(job('Backend Engineer', 'https://razorpay.com/jobs/1'))
+    assert index.check(job('Backend Engineer', 'https://phonepe.com/jobs/1', company='PhonePe')) is None
+
+
+def test_title_similarity():
+    assert title_similarity('Backend Engineer', 'backend engineer') == 1.0
+    assert title_similarity('Backend Engineer', 'Backend Engineer II') < 0.9
+
+
+def test_postings_without_description_are_matched_by_link_only():
+    index = DedupIndex()
+    bengaluru = job('Software Engineer', 'https://in.linkedin.com/jobs/view/101', '', company='Google')
+    hyderabad = job('Software Engineer', 'https://in.linkedin.com/jobs/view/202', '', company='Google')
+    assert index.check(bengaluru) is None
+    assert index.check(hyderabad) is None
+    assert index.check(dict(bengaluru, direct_apply_link='https://in.linkedin.com/jobs/view/101?utm_source=share'))
+    assert index.stats == {'checked': 3, 'exact_duplicates': 1, 'near_duplicates': 0}
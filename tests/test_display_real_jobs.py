@@ -0,0 +1,30 @@
+import pandas as pd
+import pytest
+
+from display_real_jobs import load_page, parse_args
+from job_storage import columnar_available, write_jobs
+
+
+def scored_jobs():
+    return pd.DataFrame({
+        'company_name': ['Razorpay', 'Cred', 'Groww'],
+        'offered_position': ['Backend Engineer', 'Android Developer', 'QA Analyst'],
+        'direct_apply_link': ['https://razorpay.com/jobs/1', 'https://cred.club/jobs/2', 'https://groww.in/jobs/3'],
+        'job_description': ['', '', ''],
+        'hr_email': ['', '', ''],
+        'scraped_at': ['2026-03-01T10:00:00'] * 3,
+        'relevance_score': [4.5, 3.0, 0.5]
+    })
+
+
+@pytest.mark.parametrize('fmt', ['csv', 'parquet'])
+def test_min_score_filter(tmp_path, fmt):
+    if fmt != 'csv' and not columnar_available():
+        pytest.skip('pyarrow is not installed')
+    path = write_jobs(scored_jobs(), str(tmp_path / 'jobs'), fmt)
+    page, has_more = load_page(path, {'min_score': 2.0})
+    assert [row['company_name'] for row in page] == ['Razorpay', 'Cred'] and not has_more
+
+
+def test_min_score_option():
+    assert parse_args(['--min-score', '2.5']).min_score == 2.5
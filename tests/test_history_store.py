@@ -0,0 +1,102 @@
+import os
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from history_store import JobHistoryStore
+from job_storage import write_jobs
+
+
+def snapshot(company, scraped_at):
+    return pd.DataFrame({
+        'company_name': [company],
+        'offered_position': ['Backend Engineer'],
+        'direct_apply_link': [f'https://{company.lower()}.com/jobs/1'],
+        'job_description': ['Payments backend'],
+        'hr_email': [f'careers@{company.lower()}.com'],
+        'scraped_at': [scraped_at.isoformat()]
+    })
+
+
+def test_import_snapshots_keys_runs_by_sequence(tmp_path):
+    now = datetime.now()
+    write_jobs(snapshot('Razorpay', now - timedelta(days=2)), str(tmp_path / 'real_fintech_jobs_001_20260101_000000'), 'csv')
+    write_jobs(snapshot('Cred', now - timedelta(days=1)), str(tmp_path / 'real_fintech_jobs_002_20260102_000000'), 'csv')
+    store = JobHistoryStore(str(tmp_path / 'history'))
+    store.append(snapshot('Cred', now - timedelta(days=1)), '000002')
+
+    pattern = str(tmp_path / 'real_fintech_jobs_*.*')
+    assert store.import_snapshots(pattern) == 1
+    assert store.import_snapshots(pattern) == 0
+
+    # The import is compacted, so runs appended later stay newer than the compacted file
+    assert store.files() == [store.compacted_path]
+    assert sorted(store.load()['company_name']) == ['Cred', 'Razorpay']
+    store.append(snapshot('Groww', now), '000003')
+    assert os.path.basename(store.files()[-1]).startswith('part_000003')
+
+
+def test_query_returns_window_newest_first(tmp_path):
+    now = datetime(2026, 3, 10, 12, 0)
+    store = JobHistoryStore(str(tmp_path / 'history'))
+    for run, (company, days) in enumerate([('Old', 9), ('Cred', 3), ('Razorpay', 1), ('Groww', 0.5)], start=1):
+        store.append(snapshot(company, now - timedelta(days=days)), f'{run:06d}')
+
+    assert list(store.query(days_old=7, now=now)['company_name']) == ['Groww', 'Razorpay', 'Cred']
+    assert list(store.query(since=now - timedelta(days=10), until=now - timedelta(days=2))['company_name']) == ['Cred', 'Old']
+    assert list(store.query(days_old=7, now=now, columns=['company_name']).columns) == ['company_name']
+
+
+def test_history_view_date_filter_uses_query(tmp_path):
+    from display_real_jobs import load_page
+
+    now = datetime.now()
+    store = JobHistoryStore(str(tmp_path / 'history'))
+    store.append(snapshot('Cred', now - timedelta(days=3)), '000001')
+    store.append(snapshot('Razorpay', now - timedelta(days=1)), '000002')
+    store.append(snapshot('Groww', now), '000003')
+
+    since = (now - timedelta(days=2)).isoformat()
+    page, has_more = load_page(store.root, {'since': since}, limit=1, history=True)
+    assert [row['company_name'] for row in page] == ['Groww'] and has_more
+    page, has_more = load_page(store.root, {'since': since, 'company': 'razor'}, history=True)
+    assert [row['company_name'] for row in page] == ['Razorpay'] and not has_more
+
+
+def test_filter_latest_jobs_keeps_undated_first_then_newest():
+    from real_job_scraper import RealJobScraper
+
+    now = datetime.now()
+    jobs = [snapshot(company, now - timedelta(days=days)).to_dict('records')[0]
+            for company, days in [('Cred', 1), ('Old', 9), ('Groww', 0.1)]]
+    jobs.append(dict(jobs[0], company_name='Undated', scraped_at=None))
+    latest = RealJobScraper.filter_latest_jobs(None, jobs, days_old=7)
+    assert [job.company_name for job in latest] == ['Undated', 'Groww', 'Cred']
+
+
+def test_history_view_finds_compacted_file_of_any_format(tmp_path):
+    from display_real_jobs import load_page
+
+    store = JobHistoryStore(str(tmp_path / 'history'), fmt='parquet')
+    store.append(snapshot('Cred', datetime.now()), '000001')
+    store.compact()
+    assert [os.path.basename(path) for path in store.files()] == ['history.parquet']
+
+    page, has_more = load_page(store.root, {}, history=True)
+    assert [row['company_name'] for row in page] == ['Cred'] and not has_more
+
+    # Compacting as CSV folds the parquet file in rather than leaving two copies
+    csv_store = JobHistoryStore(store.root)
+    csv_store.append(snapshot('Groww', datetime.now()), '000002')
+    csv_store.compact()
+    assert [os.path.basename(path) for path in csv_store.files()] == ['history.csv']
+    assert sorted(csv_store.load()['company_name']) == ['Cred', 'Groww']
+
+
+def test_viewer_creates_no_directories(tmp_path, monkeypatch):
+    from display_real_jobs import get_latest_real_csv_file, load_page
+
+    monkeypatch.chdir(tmp_path)
+    assert get_latest_real_csv_file() is None
+    assert load_page(str(tmp_path / 'data' / 'history'), {}, history=True) == ([], False)
+    assert os.listdir(tmp_path) == []
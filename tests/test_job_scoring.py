@@ -0,0 +1,21 @@
+import pandas as pd
+
+from job_scoring import DEFAULT_WEIGHTS, enrich_jobs, merge_weights
+
+
+def test_role_override_keeps_other_role_weights():
+    weights = merge_weights(DEFAULT_WEIGHTS, {'roles': {'sde': 3.0}, 'remote': 1.0})
+    assert weights['roles']['sde'] == 3.0
+    assert weights['roles']['backend'] == DEFAULT_WEIGHTS['roles']['backend']
+    assert weights['remote'] == 1.0
+    assert DEFAULT_WEIGHTS['roles']['sde'] == 1.5
+
+
+def test_enrich_uses_merged_role_weights():
+    df = pd.DataFrame({
+        'company_name': ['Acme', 'Acme'],
+        'offered_position': ['Backend Engineer', 'SDE 1'],
+        'job_description': ['', '']
+    })
+    scored = enrich_jobs(df, {'roles': {'sde': 3.0}})
+    assert list(scored['relevance_score']) == [DEFAULT_WEIGHTS['roles']['backend'], 3.0]
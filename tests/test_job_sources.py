@@ -0,0 +1,88 @@
+import json
+import shutil
+
+import pytest
+import requests
+
+from html_parsing import ParsePool
+from job_sources import SourceAdapter, build_adapters, iter_source_jobs
+from mock_job_board import FIXTURES_DIR, MockJobBoard
+
+
+def scrape(board, names, parse_pool=None):
+    sources = {name: config for name, config in board.job_sources().items() if name in names}
+    with requests.Session() as session:
+        return list(iter_source_jobs(session, build_adapters(sources), parse_pool))
+
+
+def test_base_adapter_is_abstract():
+    with pytest.raises(TypeError):
+        SourceAdapter('http://example.invalid', {})
+
+
+def test_recorded_fixtures_parse_into_jobs():
+    with MockJobBoard() as board:
+        jobs = scrape(board, ['LinkedIn', 'Indeed', 'AngelList'])
+    by_source = {}
+    for job in jobs:
+        by_source.setdefault(job['source'], []).append(job)
+    assert set(by_source) == {'LinkedIn', 'Indeed', 'AngelList'}
+    for job in jobs:
+        assert job['company_name'] and job['offered_position'] and job['direct_apply_link'].startswith('http')
+    assert by_source['AngelList'][0]['company_name'] == 'CRED'
+
+
+def test_linkedin_description_is_not_the_location():
+    with MockJobBoard() as board:
+        jobs = scrape(board, ['LinkedIn'])
+    assert jobs
+    for job in jobs:
+        assert job['location']
+        assert job['job_description'] == ''
+
+
+def test_paginates_until_an_empty_page(tmp_path):
+    # Two full LinkedIn pages (start=0 and start=25), then an empty one ends paging
+    shutil.copytree(FIXTURES_DIR, tmp_path, dirs_exist_ok=True)
+    shutil.copy(tmp_path / 'linkedin' / 'page_0.html', tmp_path / 'linkedin' / 'page_1.html')
+    (tmp_path / 'linkedin' / 'page_2.html').write_text('', encoding='utf-8')
+    with MockJobBoard(fixtures_dir=str(tmp_path)) as board:
+        jobs = scrape(board, ['LinkedIn'])
+        paths = list(board.requests)
+    assert [path.split('start=')[1] for path in paths] == ['0', '25', '50']
+    assert len(jobs) == 2 * len({job['direct_apply_link'] for job in jobs})
+
+
+def test_parse_pool_matches_inline_parsing():
+    with MockJobBoard() as board:
+        inline = scrape(board, ['LinkedIn', 'Indeed'])
+        with ParsePool(max_workers=1) as pool:
+            pooled = scrape(board, ['LinkedIn', 'Indeed'], pool)
+    key = lambda jobs: [(job['source'], job['direct_apply_link']) for job in jobs]
+    assert key(pooled) == key(inline)
+
+
+def test_malformed_page_is_skipped(tmp_path):
+    # AngelList page 1 has the wrong shape, page 2 is not JSON; page 3 still yields its jobs
+    shutil.copytree(FIXTURES_DIR, tmp_path, dirs_exist_ok=True)
+    good = (tmp_path / 'angellist' / 'page_1.json').read_text(encoding='utf-8')
+    (tmp_path / 'angellist' / 'page_1.json').write_text(json.dumps({'jobs': ['not a job']}), encoding='utf-8')
+    (tmp_path / 'angellist' / 'page_2.json').write_text('<html>maintenance</html>', encoding='utf-8')
+    (tmp_path / 'angellist' / 'page_3.json').write_text(good, encoding='utf-8')
+    with MockJobBoard(fixtures_dir=str(tmp_path)) as board:
+        sources = board.job_sources()
+        sources = {'AngelList': sources['AngelList']}
+        with requests.Session() as session:
+            jobs = list(iter_source_jobs(session, build_adapters(sources)))
+    assert [job['company_name'] for job in jobs] == ['CRED']
+
+
+def test_fetch_error_marks_the_adapter_failed():
+    with MockJobBoard() as board:
+        sources = board.job_sources()
+        sources['Indeed']['search_url'] = f'{board.base_url}/moved'
+        adapters = build_adapters({name: sources[name] for name in ['LinkedIn', 'Indeed']})
+        with requests.Session() as session:
+            jobs = list(iter_source_jobs(session, adapters))
+    assert {job['source'] for job in jobs} == {'LinkedIn'}
+    assert [adapter.failed for adapter in adapters] == [False, True]
@@ -0,0 +1,40 @@
+import time
+
+import pytest
+
+from job_verifier import ConcurrentVerifier, DEADLINE_RESULT
+
+
+def test_verification_starts_while_source_is_still_streaming():
+    started = time.monotonic()
+    first_check = []
+
+    def verify(url):
+        first_check.append(time.monotonic() - started)
+        return True, 'ok'
+
+    def slow_source():
+        for i in range(10):
+            time.sleep(0.05)
+            yield f'https://host{i % 3}.example/{i}'
+
+    verifier = ConcurrentVerifier(verify, max_workers=4, deadline=None)
+    results = list(verifier.iter_verify(slow_source()))
+    assert len(results) == 10
+    assert min(first_check) < 0.3
+
+
+def test_slow_host_does_not_block_fast_hosts():
+    def verify(url):
+        time.sleep(0.5 if 'slow' in url else 0.02)
+        return True, 'ok'
+
+    urls = [f'https://slow.example/{i}' for i in range(20)] + [f'https://fast{i % 10}.example/{i}' for i in range(60)]
+    verifier = ConcurrentVerifier(verify, max_workers=8, per_host_limit=4, deadline=1.0)
+    results = verifier.verify_all(urls)
+    assert all(result == (True, 'ok') for result in results[20:])
+    assert results.count(DEADLINE_RESULT) <= 20
+    stats = verifier.last_stats
+    assert stats['verified'] + stats['timed_out'] == len(urls)
+    # Rate is over verified URLs only; elapsed_seconds is rounded to the millisecond
+    assert stats['urls_per_second'] == pytest.approx(stats['verified'] / stats['elapsed_seconds'], rel=0.01)
@@ -0,0 +1,49 @@
+from page_classifier import classify_response, classify_text_chunks
+
+
+class StreamedResponse:
+    """Just enough of a streamed requests.Response for the classifier, recording how much was read"""
+
+    def __init__(self, body, status_code=200, encoding='utf-8'):
+        self.body = body.encode(encoding)
+        self.status_code = status_code
+        self.encoding = encoding
+        self.bytes_read = 0
+        self.closed = False
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.body), chunk_size):
+            chunk = self.body[start:start + chunk_size]
+            self.bytes_read += len(chunk)
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+
+def test_indicator_split_across_chunks():
+    assert classify_text_chunks(['We are no longer acc', 'epting applications.']) == \
+        (False, 'Closed: no longer accepting applications')
+    # Byte chunks that split both the phrase and a multi-byte character
+    response = StreamedResponse('Café jobs: this position has been filled. ' + 'x' * 50)
+    assert classify_response(response, chunk_size=7)[0] is False
+    assert response.closed
+
+
+def test_closed_indicator_after_open_one_wins():
+    assert classify_text_chunks(['<button>Apply now</button> ... Position filled'])[0] is False
+    assert classify_text_chunks(['<button>Apply now</button>', 'x' * 100, 'Hiring complete'])[0] is False
+    assert classify_text_chunks(['<button>Apply now</button>', 'x' * 100]) == (True, 'Open - Accepting applications')
+
+
+def test_stops_reading_at_closed_indicator():
+    response = StreamedResponse('Applications are closed. ' + 'x' * 100000)
+    assert classify_response(response, chunk_size=1024)[0] is False
+    assert response.bytes_read == 1024
+
+
+def test_max_bytes_cut_off():
+    response = StreamedResponse('x' * 5000 + ' position filled')
+    assert classify_response(response, chunk_size=1024, max_bytes=5000) == (True, 'Likely open - Page accessible')
+    assert response.bytes_read <= 5000 + 1024
+    assert classify_response(StreamedResponse('x' * 5000 + ' position filled'), chunk_size=1024)[0] is False
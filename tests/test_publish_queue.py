@@ -0,0 +1,82 @@
+import json
+import os
+import subprocess
+
+import pytest
+
+from publish_queue import PublishQueue
+
+
+def git(cwd, *args):
+    return subprocess.run(['git', *args], cwd=cwd, check=True, capture_output=True, text=True).stdout
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Working repository whose origin is a local bare repository"""
+    remote = tmp_path / 'remote.git'
+    work = tmp_path / 'work'
+    git(tmp_path, 'init', '--bare', str(remote))
+    git(tmp_path, 'init', str(work))
+    git(work, 'config', 'user.name', 'Scraper')
+    git(work, 'config', 'user.email', 'scraper@example.com')
+    git(work, 'remote', 'add', 'origin', str(remote))
+    (work / 'data').mkdir()
+    return work, remote
+
+
+def write_delta(work, name):
+    path = work / 'data' / name
+    path.write_text('change,company_name\nadded,Razorpay\n', encoding='utf-8')
+    return str(path)
+
+
+def remote_commits(remote):
+    return git(remote, 'log', '--all', '--format=%s').splitlines()
+
+
+def test_several_runs_become_one_commit(repo):
+    work, remote = repo
+    publisher = PublishQueue(str(work), batch_window=5)
+    for run in range(1, 4):
+        publisher.enqueue([write_delta(work, f'delta_{run}.csv')], f'Scrape run {run}')
+    publisher.close()
+
+    assert publisher.stats == {'runs': 3, 'commits': 1, 'pushes': 1, 'failures': 0}
+    assert len(remote_commits(remote)) == 1
+    committed = git(remote, 'show', '--name-only', '--format=', 'HEAD').split()
+    assert committed == ['data/delta_1.csv', 'data/delta_2.csv', 'data/delta_3.csv']
+
+
+def test_only_listed_paths_are_committed(repo):
+    work, remote = repo
+    (work / 'notes.txt').write_text('work in progress\n', encoding='utf-8')
+    git(work, 'add', 'notes.txt')
+
+    write_delta(work, 'delta_1.csv')
+    PublishQueue(str(work), batch_window=0).publish([{'paths': ['data/delta_1.csv'], 'message': 'Scrape run 1'}])
+
+    assert git(remote, 'show', '--name-only', '--format=', 'HEAD').split() == ['data/delta_1.csv']
+    assert git(work, 'diff', '--cached', '--name-only').split() == ['notes.txt']
+
+
+def test_failed_push_is_kept_pending_and_retried(repo):
+    work, remote = repo
+    publisher = PublishQueue(str(work), remote='unreachable', batch_window=0)
+    publisher.enqueue([write_delta(work, 'delta_1.csv')], 'Scrape run 1')
+    publisher.close()
+
+    assert publisher.stats['failures'] == 1
+    with open(publisher.pending_path, encoding='utf-8') as f:
+        assert [entry['message'] for entry in json.load(f)] == ['Scrape run 1']
+    assert remote_commits(remote) == []
+
+    # The next start picks the run up from the pending file and pushes the commit left behind
+    retry = PublishQueue(str(work), batch_window=0)
+    retry.start()
+    retry.close()
+    assert retry.stats['pushes'] == 1
+    assert remote_commits(remote) == ['Scrape run 1']
+    with open(retry.pending_path, encoding='utf-8') as f:
+        assert json.load(f) == []
+    assert os.path.exists(work / 'data' / 'delta_1.csv')
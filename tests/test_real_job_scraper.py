@@ -0,0 +1,64 @@
+import pytest
+
+from mock_job_board import MockJobBoard
+from real_job_scraper import RealJobScraper
+
+
+def new_scraper(tmp_path, **kwargs):
+    options = {'cache_path': None, 'seen_index_path': None, 'manifest_path': str(tmp_path / 'manifest.json'),
+               'parse_workers': 0, 'max_retries': 0}
+    options.update(kwargs)
+    return RealJobScraper(**options)
+
+
+@pytest.mark.parametrize('board_options, status_msg', [
+    ({'gone_ratio': 1.0}, 'HTTP 410'),
+    ({'landing_ratio': 1.0}, 'Closed: redirected to'),
+])
+def test_gone_and_landing_redirects_are_decided_by_head(tmp_path, board_options, status_msg):
+    scraper = new_scraper(tmp_path)
+    with MockJobBoard(redirect_ratio=0.0, **board_options) as board:
+        is_open, message, tier = scraper.verify_with_tier(board.career_url(1))
+        requests_sent = len(board.requests)
+    scraper.close()
+    assert (is_open, tier) == (False, 'head')
+    assert message.startswith(status_msg)
+    assert requests_sent == 1 + ('landing_ratio' in board_options)
+
+
+@pytest.mark.parametrize('closed_ratio, expected', [(0.0, True), (1.0, False)])
+def test_ambiguous_pages_fall_through_to_get(tmp_path, closed_ratio, expected):
+    scraper = new_scraper(tmp_path)
+    with MockJobBoard(redirect_ratio=0.0, closed_ratio=closed_ratio) as board:
+        is_open, _, tier = scraper.verify_with_tier(board.career_url(1))
+        requests_sent = len(board.requests)
+    scraper.close()
+    assert (is_open, tier) == (expected, 'get')
+    assert requests_sent == 2
+
+
+def test_etag_match_reuses_stale_cached_verdict(tmp_path):
+    # ttl=0: every cached verdict is stale, so it is revalidated rather than served directly
+    scraper = new_scraper(tmp_path, cache_path=str(tmp_path / 'cache.sqlite'), cache_ttl=0)
+    with MockJobBoard(redirect_ratio=0.0, closed_ratio=1.0) as board:
+        url = board.career_url(1)
+        first = scraper.verify_with_tier(url)
+        before = len(board.requests)
+        second = scraper.verify_with_tier(url)
+        requests_sent = len(board.requests) - before
+    scraper.close()
+    assert first[2] == 'get'
+    assert second == (first[0], first[1], 'head')
+    assert requests_sent == 1
+
+
+def test_snapshot_is_saved_most_relevant_first(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'data').mkdir()
+    scraper = new_scraper(tmp_path, history_dir=str(tmp_path / 'history'))
+    with MockJobBoard() as board:
+        scraper.jobs_data = board.career_jobs(10)
+    df, _ = scraper.save_real_jobs()
+    scraper.close()
+    scores = list(df['relevance_score'])
+    assert scores == sorted(scores, reverse=True) and scores[0] > scores[-1]
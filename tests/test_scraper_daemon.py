@@ -0,0 +1,87 @@
+import glob
+import json
+
+import pandas as pd
+import pytest
+
+from job_records import as_record
+from job_storage import read_jobs
+from mock_job_board import MockJobBoard
+from real_job_scraper import RealJobScraper
+from scraper_daemon import ScraperDaemon
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'data').mkdir()
+    scraper = RealJobScraper(cache_path=None, seen_index_path=str(tmp_path / 'seen.sqlite'), reverify_after=0,
+                             history_dir=str(tmp_path / 'history'), manifest_path=str(tmp_path / 'manifest.json'),
+                             parse_workers=0, verify_deadline=10)
+    scraper.metrics_dir = str(tmp_path / 'metrics')
+    yield scraper
+    scraper.close()
+
+
+def test_each_source_run_saves_every_source(scraper):
+    with MockJobBoard() as board:
+        runs = {name: [dict(job, source=name)] for name, job in zip(['LinkedIn', 'AngelList'], board.career_jobs(2))}
+
+    def create_real_job_links(sources):
+        scraper.jobs_data = [as_record(job) for job in runs[sources[0]]]
+
+    scraper.create_real_job_links = create_real_job_links
+    daemon = ScraperDaemon(scraper, source_intervals={})
+    daemon.run_source('LinkedIn')
+    daemon.run_source('AngelList')
+
+    latest = read_jobs(scraper.run_manifest.latest_path())
+    assert sorted(latest['source']) == ['AngelList', 'LinkedIn']
+
+    # A restarted daemon picks the sources up from that snapshot
+    restarted = ScraperDaemon(scraper, source_intervals={})
+    restarted.load_latest_snapshot()
+    assert {name: len(jobs) for name, jobs in restarted.source_jobs.items()} == {'LinkedIn': 1, 'AngelList': 1}
+
+
+def test_reverify_writes_closures_and_metrics(scraper):
+    with MockJobBoard(closed_ratio=1.0, redirect_ratio=0.0) as board:
+        jobs = board.career_jobs(3)
+        for job in jobs:
+            scraper.seen_index.record(job, True, 'Accepting applications')
+        daemon = ScraperDaemon(scraper, source_intervals={})
+        daemon.source_jobs = {'Curated': [as_record(job) for job in jobs]}
+        daemon.reverify()
+
+    assert daemon.stats['reverify_closed'] == 3
+    assert daemon.source_jobs == {'Curated': []}
+    delta = pd.read_csv(glob.glob('data/real_fintech_reverify_delta_*.csv')[0])
+    assert list(delta['change']) == ['closed'] * 3
+    with open(glob.glob(f'{scraper.metrics_dir}/reverify_*.json')[0], encoding='utf-8') as f:
+        assert json.load(f)['counters']['reverify_closed'] == 3
+
+
+def test_failed_fetch_keeps_the_previous_postings(scraper):
+    with MockJobBoard() as board:
+        jobs = [dict(job, source='LinkedIn') for job in board.career_jobs(3)]
+
+    def create_real_job_links(sources):
+        # Only the first page arrived before the source started failing
+        scraper.jobs_data = [as_record(jobs[0])]
+        scraper.failed_sources = {'LinkedIn'}
+
+    daemon = ScraperDaemon(scraper, source_intervals={})
+    daemon.source_jobs = {'LinkedIn': [as_record(job) for job in jobs]}
+    scraper.create_real_job_links = create_real_job_links
+    daemon.run_source('LinkedIn')
+
+    assert len(daemon.source_jobs['LinkedIn']) == 3
+    assert len(read_jobs(scraper.run_manifest.latest_path())) == 3
+
+
+def test_run_report_counts_only_this_run(scraper):
+    scraper.transport.stats['requests'] = 40
+    scraper.reset_run()
+    scraper.transport.stats['requests'] += 2
+    with open(scraper.write_metrics_report(run_name='second'), encoding='utf-8') as f:
+        assert json.load(f)['counters']['http_requests'] == 2
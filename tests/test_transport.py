@@ -0,0 +1,90 @@
+import socket
+import threading
+import time
+
+import requests
+from urllib3.exceptions import MaxRetryError, NameResolutionError
+
+from transport import CircuitBreaker, is_transient_error
+
+
+def open_breaker():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert not breaker.allow()
+    time.sleep(0.06)
+    return breaker
+
+
+def test_half_open_lets_exactly_one_probe_through():
+    breaker = open_breaker()
+    allowed = []
+    barrier = threading.Barrier(3)
+
+    def call():
+        barrier.wait()
+        allowed.append(breaker.allow())
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(allowed) == [False, False, True]
+
+
+def test_probe_outcome_closes_or_reopens():
+    breaker = open_breaker()
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.allow() and breaker.allow()
+
+    breaker = open_breaker()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert not breaker.allow()
+
+
+def test_probe_without_verdict_frees_the_slot():
+    breaker = open_breaker()
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.release()
+    assert breaker.allow()
+
+
+def resolution_error(errno):
+    """ConnectionError shaped like the one requests raises when getaddrinfo fails"""
+    cause = socket.gaierror(errno, 'lookup failed')
+    try:
+        raise NameResolutionError('jobs.example', None, cause) from cause
+    except NameResolutionError as reason:
+        return requests.ConnectionError(MaxRetryError(None, 'https://jobs.example/1', reason))
+
+
+def test_dead_domain_is_a_hard_error():
+    assert not is_transient_error(resolution_error(socket.EAI_NONAME))
+    # A resolver that is briefly unreachable says nothing about the posting
+    assert is_transient_error(resolution_error(socket.EAI_AGAIN))
+    try:
+        requests.get('http://127.0.0.1:1/', timeout=2)
+    except requests.ConnectionError as refused:
+        assert is_transient_error(refused)
+
+
+def test_dead_domain_posting_is_closed(tmp_path):
+    from real_job_scraper import RealJobScraper
+
+    scraper = RealJobScraper(cache_path=None, seen_index_path=None, manifest_path=str(tmp_path / 'manifest.json'),
+                             parse_workers=0)
+
+    def fail(*args, **kwargs):
+        raise resolution_error(socket.EAI_NONAME)
+
+    scraper.transport.head = scraper.transport.get = fail
+    try:
+        is_open, status_msg, tier = scraper.verify_with_tier('https://jobs.example/1')
+    finally:
+        scraper.close()
+    assert (is_open, tier) == (False, 'error')
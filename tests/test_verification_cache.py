@@ -0,0 +1,30 @@
+from verification_cache import VerificationCache
+
+
+def test_lookup_counts_once_and_reads_do_not_write(tmp_path):
+    cache = VerificationCache(str(tmp_path / 'cache.sqlite'), ttl=3600)
+    cache.put('https://razorpay.com/jobs/1', True, 'Open')
+    before = cache._conn.total_changes
+    entry = cache.get('https://razorpay.com/jobs/1?utm_source=x')
+    assert cache.is_fresh(entry) and cache.is_fresh(entry)
+    assert cache.get('https://razorpay.com/jobs/2') is None
+    assert cache._conn.total_changes == before
+    assert cache.stats['hits'] == 1 and cache.stats['misses'] == 1
+    cache.close()
+
+
+def test_size_cap_evicts_least_recently_used(tmp_path):
+    path = str(tmp_path / 'cache.sqlite')
+    cache = VerificationCache(path, max_entries=3, access_batch=100)
+    for i in range(3):
+        cache.put(f'https://example.com/{i}', True, 'Open')
+    cache.get('https://example.com/0')  # pending access makes 1 the least recently used
+    cache.put('https://example.com/3', True, 'Open')
+    cache.put('https://example.com/3', False, 'Closed')  # replacing does not grow the table
+    assert cache.get('https://example.com/1') is None
+    assert cache.get('https://example.com/0') is not None
+    cache.close()
+
+    reopened = VerificationCache(path, max_entries=3)
+    assert reopened._rows == 3
+    reopened.close()
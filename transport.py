@@ -0,0 +1,255 @@
+"""
+HTTP transport layer for the shared requests.Session
+Per-host connection pools, adaptive token-bucket rate limiting, retries with jittered backoff and a circuit breaker
+"""
+
+import random
+import socket
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# getaddrinfo errors saying the host does not exist, unlike EAI_AGAIN from a resolver that is briefly unreachable
+HOST_NOT_FOUND_ERRNOS = {socket.EAI_NONAME, getattr(socket, 'EAI_NODATA', socket.EAI_NONAME)}
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised instead of sending a request to a host whose circuit is open"""
+
+
+def is_host_not_found(error):
+    """Check if a request failed because DNS says the host does not exist"""
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        if isinstance(error, socket.gaierror):
+            return error.errno in HOST_NOT_FOUND_ERRNOS
+        # requests wraps urllib3's MaxRetryError, whose reason wraps the resolver's gaierror
+        nested = error.args[0] if error.args and isinstance(error.args[0], BaseException) else None
+        error = getattr(error, 'reason', None) or nested or error.__cause__ or error.__context__
+    return False
+
+
+def is_transient_error(error):
+    """Check if a request exception is worth retrying (network trouble, not a bad URL or a dead domain)"""
+    return (isinstance(error, (requests.ConnectionError, requests.Timeout, CircuitOpenError))
+            and not is_host_not_found(error))
+
+
+def parse_retry_after(value):
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """Token bucket whose rate halves on 429s and slowly recovers on successes"""
+
+    def __init__(self, rate=5.0, burst=5, min_rate=0.2):
+        self.max_rate = float(rate)
+        self.rate = float(rate)
+        self.min_rate = min_rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be sent; returns seconds spent waiting"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if now >= self.blocked_until and self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = max(self.blocked_until - now, (1 - self.tokens) / self.rate)
+            time.sleep(delay)
+            waited += delay
+
+    def penalize(self, retry_after=None):
+        """Slow down after a 429, honoring Retry-After when given"""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.tokens = 0.0
+            if retry_after:
+                self.blocked_until = max(self.blocked_until, time.monotonic() + retry_after)
+
+    def reward(self):
+        """Additively recover towards the configured rate after a success"""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate * 0.1)
+
+
+class CircuitBreaker:
+    """Stops requests to a host after repeated failures, then lets one probe through after a cool-down"""
+
+    def __init__(self, failure_threshold=5, reset_timeout=60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        # Thread whose half-open probe is in flight; everyone else is refused until its outcome is recorded
+        self.probe_owner = None
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if self.probe_owner is None and time.monotonic() - self.opened_at >= self.reset_timeout:
+                # Half-open: exactly one probe goes through
+                self.probe_owner = threading.get_ident()
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self.probe_owner = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.probe_owner is not None or self.failures >= self.failure_threshold:
+                # A failed probe re-opens for another full cool-down
+                self.opened_at = time.monotonic()
+                self.probe_owner = None
+
+    def release(self):
+        """End this thread's probe without a verdict (e.g. a 429), so the next caller may probe"""
+        with self._lock:
+            if self.probe_owner == threading.get_ident():
+                self.probe_owner = None
+
+
+class ResilientTransport:
+    def __init__(self, session, pool_connections=16, pool_maxsize=10, host_pool_sizes=None,
+                 rate=5.0, burst=5, max_retries=3, backoff_base=0.5, backoff_max=30.0,
+                 breaker_threshold=5, breaker_reset=60.0, metrics=None):
+        self.session = session
+        self.rate = rate
+        self.burst = burst
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.breaker_threshold = breaker_threshold
+        self.breaker_reset = breaker_reset
+        self.stats = {'requests': 0, 'retries': 0, 'rate_limited': 0, 'circuit_open': 0}
+        self.metrics = metrics
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+        # Connection pools: a default size for every host plus overrides for busy hosts
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        for host, size in (host_pool_sizes or {}).items():
+            host_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=size)
+            session.mount(f'http://{host}/', host_adapter)
+            session.mount(f'https://{host}/', host_adapter)
+
+    def _host_state(self, url):
+        host = (urlsplit(url).hostname or '').lower()
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                state = (TokenBucket(self.rate, self.burst), CircuitBreaker(self.breaker_threshold, self.breaker_reset))
+                self._hosts[host] = state
+        return host, state
+
+    def backoff_delay(self, attempt, retry_after=None):
+        """Exponential backoff with full jitter, never shorter than Retry-After"""
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+        return max(delay, retry_after or 0.0)
+
+    def count(self, name):
+        """Bump a stats counter (requests run on many worker threads)"""
+        with self._lock:
+            self.stats[name] += 1
+
+    def request(self, method, url, **kwargs):
+        """Send a request through the host's rate limiter and circuit breaker, retrying transient failures"""
+        host, (bucket, breaker) = self._host_state(url)
+
+        for attempt in range(self.max_retries + 1):
+            if not breaker.allow():
+                self.count('circuit_open')
+                raise CircuitOpenError(f"Circuit open for {host}")
+
+            try:
+                response = self._attempt(method, url, host, bucket, breaker, **kwargs)
+            except requests.RequestException as e:
+                if not is_transient_error(e) or attempt == self.max_retries:
+                    raise
+                self.count('retries')
+                time.sleep(self.backoff_delay(attempt))
+                continue
+            finally:
+                breaker.release()
+
+            if response.status_code not in RETRY_STATUSES:
+                return response
+
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            # Give up rather than park a worker when the host asks for a long pause
+            if attempt == self.max_retries or (retry_after or 0) > self.backoff_max:
+                return response
+
+            response.close()
+            self.count('retries')
+            time.sleep(self.backoff_delay(attempt, retry_after))
+
+    def _attempt(self, method, url, host, bucket, breaker, **kwargs):
+        """One rate-limited request whose outcome is recorded on the host's breaker and bucket"""
+        bucket.acquire()
+        self.count('requests')
+        started = time.perf_counter()
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except requests.RequestException as e:
+            if self.metrics:
+                self.metrics.inc('http_errors')
+            if is_transient_error(e):
+                breaker.record_failure()
+            raise
+
+        if self.metrics:
+            size = response.headers.get('Content-Length')
+            self.metrics.observe_request(host, time.perf_counter() - started,
+                                         int(size) if size and size.isdigit() else None)
+            self.metrics.inc(f'http_status_{response.status_code}')
+
+        if response.status_code not in RETRY_STATUSES:
+            breaker.record_success()
+            bucket.reward()
+        elif response.status_code == 429:
+            self.count('rate_limited')
+            bucket.penalize(parse_retry_after(response.headers.get('Retry-After')))
+        else:
+            breaker.record_failure()
+        return response
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def head(self, url, **kwargs):
+        return self.request('HEAD', url, **kwargs)
@@ -1,8 +0,0 @@
-"""
-Quick update and push script - Use this after making any changes
-"""
-
-from auto_commit import auto_commit_and_push
-
-if __name__ == "__main__":
-    auto_commit_and_push()
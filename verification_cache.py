@@ -0,0 +1,177 @@
+"""
+Persistent verification cache
+Stores job-status verdicts in SQLite keyed by normalized URL, with TTL, LRU size cap and conditional revalidation
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def normalize_url(url):
+    """Normalize a URL so equivalent links share one cache entry"""
+    try:
+        parts = urlsplit(url.strip())
+    except (AttributeError, ValueError):
+        return url
+
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+
+    path = parts.path or '/'
+    if len(path) > 1 and path.endswith('/'):
+        path = path.rstrip('/')
+
+    # Drop tracking parameters and sort the rest so parameter order does not matter
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+             if not k.lower().startswith('utm_')]
+    query.sort()
+
+    return urlunsplit((scheme, host, path, urlencode(query), ''))
+
+
+class VerificationCache:
+    def __init__(self, path='data/verification_cache.sqlite', ttl=6 * 3600, max_entries=50000, access_batch=256):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.stats = {'hits': 0, 'stale': 0, 'misses': 0, 'revalidated': 0, 'stores': 0}
+        self._lock = threading.Lock()
+        # Reads only note their access time; the LRU column is written in batches of access_batch
+        self.access_batch = access_batch
+        self._accessed = {}
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS verification_cache (
+                kind TEXT NOT NULL,
+                url TEXT NOT NULL,
+                is_open INTEGER NOT NULL,
+                status_msg TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (kind, url)
+            )
+        """)
+        self._conn.execute(
+            'CREATE INDEX IF NOT EXISTS idx_verification_cache_access ON verification_cache (last_access)'
+        )
+        self._conn.commit()
+        # Running row count, so stores never need a COUNT(*)
+        self._rows = self._conn.execute('SELECT COUNT(*) FROM verification_cache').fetchone()[0]
+
+    def get(self, url, kind='verify'):
+        """Get cached entry for URL (or None) and mark it as recently used"""
+        key = normalize_url(url)
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT is_open, status_msg, etag, last_modified, fetched_at '
+                'FROM verification_cache WHERE kind = ? AND url = ?',
+                (kind, key)
+            ).fetchone()
+            if row is None:
+                self.stats['misses'] += 1
+                return None
+            entry = {
+                'is_open': bool(row[0]),
+                'status_msg': row[1],
+                'etag': row[2],
+                'last_modified': row[3],
+                'fetched_at': row[4],
+            }
+            self.stats['hits' if self.is_fresh(entry) else 'stale'] += 1
+            self._accessed[(kind, key)] = time.time()
+            if len(self._accessed) >= self.access_batch:
+                self._flush_access()
+                self._conn.commit()
+        return entry
+
+    def is_fresh(self, entry):
+        """Check if a cached entry is still within its TTL"""
+        return entry is not None and (time.time() - entry['fetched_at']) < self.ttl
+
+    @staticmethod
+    def conditional_headers(entry):
+        """Build If-None-Match / If-Modified-Since headers for revalidating a stale entry"""
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def put(self, url, is_open, status_msg, etag=None, last_modified=None, kind='verify'):
+        """Store a verdict for URL and enforce the LRU size cap"""
+        now = time.time()
+        key = normalize_url(url)
+        with self._lock:
+            exists = self._conn.execute(
+                'SELECT 1 FROM verification_cache WHERE kind = ? AND url = ?', (kind, key)
+            ).fetchone() is not None
+            self._conn.execute(
+                'INSERT OR REPLACE INTO verification_cache '
+                '(kind, url, is_open, status_msg, etag, last_modified, fetched_at, last_access) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (kind, key, int(bool(is_open)), status_msg, etag, last_modified, now, now)
+            )
+            self._accessed.pop((kind, key), None)
+            if not exists:
+                self._rows += 1
+            self._evict()
+            self._conn.commit()
+            self.stats['stores'] += 1
+
+    def touch(self, url, kind='verify'):
+        """Mark a cached verdict as revalidated (e.g. after a 304 Not Modified)"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                'UPDATE verification_cache SET fetched_at = ?, last_access = ? WHERE kind = ? AND url = ?',
+                (now, now, kind, normalize_url(url))
+            )
+            self._accessed.pop((kind, normalize_url(url)), None)
+            self._conn.commit()
+            self.stats['revalidated'] += 1
+
+    def _flush_access(self):
+        """Write batched last-access times (caller holds the lock and commits)"""
+        if self._accessed:
+            self._conn.executemany(
+                'UPDATE verification_cache SET last_access = ? WHERE kind = ? AND url = ?',
+                [(accessed, kind, key) for (kind, key), accessed in self._accessed.items()]
+            )
+            self._accessed.clear()
+
+    def _evict(self):
+        """Drop least recently used entries beyond max_entries"""
+        if not self.max_entries or self._rows <= self.max_entries:
+            return
+        # Pending access times decide which entries are least recently used
+        self._flush_access()
+        deleted = self._conn.execute(
+            'DELETE FROM verification_cache WHERE rowid IN ('
+            'SELECT rowid FROM verification_cache ORDER BY last_access ASC LIMIT ?)',
+            (self._rows - self.max_entries,)
+        ).rowcount
+        self._rows -= deleted
+
+    def close(self):
+        """Write pending access times and close the underlying database"""
+        with self._lock:
+            self._flush_access()
+            self._conn.commit()
+            self._conn.close()